@@ -22,10 +22,15 @@ from pathlib import Path
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from src.extract_llm import extract_fields_via_llm_batch  # noqa: E402
 from src.output import generate_summary_line, generate_validation_json  # noqa: E402
 from src.pipeline import validate_certificate  # noqa: E402
 from src.report import generate_csv_export, generate_portfolio_report  # noqa: E402
 
+# Certs per LLM batch: large enough to keep the request pool busy, small enough
+# that per-cert JSON output keeps flowing on long runs.
+LLM_BATCH_SIZE = 32
+
 
 def _write_portfolio_artifacts(results, output_dir: Path) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -40,7 +45,13 @@ def _write_portfolio_artifacts(results, output_dir: Path) -> None:
     print(f"Saved CSV export: {csv_path}")
 
 
-def run_batch_local(directory: str, limit: int = None, output_dir: str = "output", state: str = None):
+def run_batch_local(
+    directory: str,
+    limit: int = None,
+    output_dir: str = "output",
+    state: str = None,
+    template_first: bool = False,
+):
     """Process all PDFs in a directory and generate portfolio report outputs."""
     directory_path = Path(directory)
     if not directory_path.exists() or not directory_path.is_dir():
@@ -55,16 +66,19 @@ def run_batch_local(directory: str, limit: int = None, output_dir: str = "output
 
     results = []
     total = len(pdfs)
-    for idx, pdf in enumerate(pdfs, start=1):
-        print(f"Processing {idx}/{total}: {pdf.name}...")
-        result = validate_certificate(str(pdf), state=state)
-        if result.cert_id is None:
-            result.cert_id = pdf.stem
-        results.append(result)
+    for start in range(0, total, LLM_BATCH_SIZE):
+        batch = pdfs[start:start + LLM_BATCH_SIZE]
+        llm_fields = extract_fields_via_llm_batch([str(pdf) for pdf in batch], template_first=template_first)
+        for idx, (pdf, fields) in enumerate(zip(batch, llm_fields), start=start + 1):
+            print(f"Processing {idx}/{total}: {pdf.name}...")
+            result = validate_certificate(str(pdf), state=state, llm_fields=fields)
+            if result.cert_id is None:
+                result.cert_id = pdf.stem
+            results.append(result)
 
-        json_output = output_path / f"{pdf.stem}.json"
-        json_output.write_text(generate_validation_json(result), encoding="utf-8")
-        print(generate_summary_line(result))
+            json_output = output_path / f"{pdf.stem}.json"
+            json_output.write_text(generate_validation_json(result), encoding="utf-8")
+            print(generate_summary_line(result))
 
     _write_portfolio_artifacts(results, output_path)
 
@@ -85,6 +99,7 @@ def run_batch_avalara(
     customer: str = None,
     output_dir: str = "output",
     state: str = None,
+    template_first: bool = False,
 ):
     """Pull certs from Avalara API, validate them, and emit report artifacts."""
     from src.avalara import AvalaraClient
@@ -109,25 +124,33 @@ def run_batch_avalara(
 
     results = []
     with tempfile.TemporaryDirectory(prefix="certbot-avalara-") as temp_dir:
-        for idx, cert in enumerate(certs, start=1):
-            cert_id = cert.get("id")
-            if cert_id is None:
-                continue
-            print(f"Processing {idx}/{len(certs)}: Avalara certificate {cert_id}...")
-
-            temp_pdf = Path(temp_dir) / f"avalara_{cert_id}.pdf"
-            client.download_certificate_pdf(int(cert_id), str(temp_pdf))
-
-            result = validate_certificate(str(temp_pdf), state=state)
-            result.avalara_cert_id = int(cert_id)
-            result.cert_id = str(cert_id)
-            if not result.customer_name or result.customer_name.lower() == "unknown":
-                result.customer_name = cert.get("customerName") or cert.get("customerCode") or "Unknown"
-            results.append(result)
-
-            json_output = output_path / f"avalara_{cert_id}.json"
-            json_output.write_text(generate_validation_json(result), encoding="utf-8")
-            print(generate_summary_line(result))
+        for start in range(0, len(certs), LLM_BATCH_SIZE):
+            downloaded = []
+            for idx, cert in enumerate(certs[start:start + LLM_BATCH_SIZE], start=start + 1):
+                cert_id = cert.get("id")
+                if cert_id is None:
+                    continue
+                print(f"Processing {idx}/{len(certs)}: Avalara certificate {cert_id}...")
+
+                temp_pdf = Path(temp_dir) / f"avalara_{cert_id}.pdf"
+                client.download_certificate_pdf(int(cert_id), str(temp_pdf))
+                downloaded.append((cert, cert_id, temp_pdf))
+
+            llm_fields = extract_fields_via_llm_batch(
+                [str(temp_pdf) for _, _, temp_pdf in downloaded],
+                template_first=template_first,
+            )
+            for (cert, cert_id, temp_pdf), fields in zip(downloaded, llm_fields):
+                result = validate_certificate(str(temp_pdf), state=state, llm_fields=fields)
+                result.avalara_cert_id = int(cert_id)
+                result.cert_id = str(cert_id)
+                if not result.customer_name or result.customer_name.lower() == "unknown":
+                    result.customer_name = cert.get("customerName") or cert.get("customerCode") or "Unknown"
+                results.append(result)
+
+                json_output = output_path / f"avalara_{cert_id}.json"
+                json_output.write_text(generate_validation_json(result), encoding="utf-8")
+                print(generate_summary_line(result))
 
     _write_portfolio_artifacts(results, output_path)
 
@@ -140,15 +163,32 @@ def main():
     parser.add_argument("--customer", help="Filter by customer name")
     parser.add_argument("--output", default="output", help="Output directory for results")
     parser.add_argument("--state", help="Override state for all certs")
+    parser.add_argument(
+        "--template-first",
+        action="store_true",
+        help="Skip the LLM for digital PDFs of recognized forms that parse fully by regex",
+    )
 
     args = parser.parse_args()
 
     if args.avalara:
-        run_batch_avalara(limit=args.limit, customer=args.customer, output_dir=args.output, state=args.state)
+        run_batch_avalara(
+            limit=args.limit,
+            customer=args.customer,
+            output_dir=args.output,
+            state=args.state,
+            template_first=args.template_first,
+        )
         return
 
     if args.directory:
-        run_batch_local(args.directory, limit=args.limit, output_dir=args.output, state=args.state)
+        run_batch_local(
+            args.directory,
+            limit=args.limit,
+            output_dir=args.output,
+            state=args.state,
+            template_first=args.template_first,
+        )
         return
 
     raise SystemExit("Provide either --dir PATH or --avalara")
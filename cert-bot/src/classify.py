@@ -75,50 +75,62 @@ FOR_PROFIT_INDICATORS = [
 ]
 
 
-def _contains_any(text: str, indicators: list[str]) -> bool:
-    lower_text = text.lower()
-    return any(ind.lower() in lower_text for ind in indicators)
+def _lowered(indicators: list[str]) -> tuple[str, ...]:
+    return tuple(ind.lower() for ind in indicators)
+
+
+_FEDERAL_LOWER = _lowered(FEDERAL_INDICATORS)
+_STATE_GOVERNMENT_LOWER = _lowered(STATE_GOVERNMENT_INDICATORS)
+_LOCAL_GOVERNMENT_LOWER = _lowered(LOCAL_GOVERNMENT_INDICATORS)
+_TRIBAL_CONTEXT_LOWER = _lowered([i for i in TRIBAL_INDICATORS if i != "Nation"])
+_EDUCATIONAL_LOWER = _lowered(EDUCATIONAL_INDICATORS)
+_NONPROFIT_LOWER = _lowered(NONPROFIT_INDICATORS)
+_RELIGIOUS_LOWER = _lowered(RELIGIOUS_INDICATORS)
+_FOR_PROFIT_LOWER = _lowered(FOR_PROFIT_INDICATORS)
+
+
+def _contains_any(lower_text: str, lowered_indicators: tuple[str, ...]) -> bool:
+    return any(ind in lower_text for ind in lowered_indicators)
 
 
 def classify_entity(fields: ExtractedFields) -> EntityType:
     """Classify the purchaser's entity type from extracted cert content."""
-    source = " ".join([fields.purchaser_name or "", fields.raw_text or ""])
-    lower = source.lower()
+    lower = " ".join([fields.purchaser_name or "", fields.raw_text or ""]).lower()
 
-    if _contains_any(source, FEDERAL_INDICATORS):
+    if _contains_any(lower, _FEDERAL_LOWER):
         return EntityType.FEDERAL_GOVERNMENT
 
     if "state university" in lower:
         return EntityType.STATE_GOVERNMENT
 
-    if _contains_any(source, STATE_GOVERNMENT_INDICATORS):
+    if _contains_any(lower, _STATE_GOVERNMENT_LOWER):
         return EntityType.STATE_GOVERNMENT
 
     if "parish of" in lower:
         return EntityType.LOCAL_GOVERNMENT
 
-    if _contains_any(source, LOCAL_GOVERNMENT_INDICATORS):
+    if _contains_any(lower, _LOCAL_GOVERNMENT_LOWER):
         return EntityType.LOCAL_GOVERNMENT
 
-    tribal_context = _contains_any(source, [i for i in TRIBAL_INDICATORS if i != "Nation"])
+    tribal_context = _contains_any(lower, _TRIBAL_CONTEXT_LOWER)
     if tribal_context or ("nation" in lower and "tribal" in lower):
         return EntityType.TRIBAL
 
-    education = _contains_any(source, EDUCATIONAL_INDICATORS)
-    nonprofit = _contains_any(source, NONPROFIT_INDICATORS)
+    education = _contains_any(lower, _EDUCATIONAL_LOWER)
+    nonprofit = _contains_any(lower, _NONPROFIT_LOWER)
     if education:
         return EntityType.EDUCATIONAL
 
     if nonprofit:
         return EntityType.NONPROFIT_501C3
 
-    if "parish" in lower and _contains_any(source, RELIGIOUS_INDICATORS):
+    if "parish" in lower and _contains_any(lower, _RELIGIOUS_LOWER):
         return EntityType.RELIGIOUS
 
-    if _contains_any(source, RELIGIOUS_INDICATORS):
+    if _contains_any(lower, _RELIGIOUS_LOWER):
         return EntityType.RELIGIOUS
 
-    if _contains_any(source, FOR_PROFIT_INDICATORS):
+    if _contains_any(lower, _FOR_PROFIT_LOWER):
         return EntityType.FOR_PROFIT
 
     return EntityType.UNKNOWN
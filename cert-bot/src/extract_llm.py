@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 from importlib import import_module
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from pathlib import Path
 
 
-from .ingest import extract_text_from_pdf
+from .ingest import extract_digital_text, extract_text_from_pdf
 from .models import ExtractedFields
 from .parse import extract_exemption_states, extract_fields_regex, identify_form_type, map_llm_form_type
-from .utils import normalize_state, parse_date
+from .utils import load_config, normalize_state, parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +46,25 @@ Important rules:
 - If a field is truly not present or illegible, use null rather than guessing"""
 
 
+LLM_MODEL = "gpt-4o"
+
+# Responses are requested at temperature 0, so the parsed payload for a given
+# PDF, model and prompt is reused instead of paying for another round-trip.
+# Set CERT_BOT_LLM_CACHE_DIR to persist payloads across runs.
+_PROMPT_DIGEST = hashlib.sha256(EXTRACTION_PROMPT.encode("utf-8")).hexdigest()[:16]
+_PAYLOAD_CACHE_MAX = 1024
+_PAYLOAD_CACHE: dict[str, dict] = {}
+_PAYLOAD_CACHE_LOCK = threading.Lock()
+
+# identify_form_type reports >= 0.95 only for explicit form-number matches.
+# Below that, the form guess itself is uncertain and the LLM should decide.
+_TEMPLATE_MIN_CONFIDENCE = 0.95
+
+# PyMuPDF documents must not be used from several threads at once, so batch
+# extraction renders one PDF at a time and only overlaps the API round-trips.
+_RENDER_LOCK = threading.Lock()
+
+
 def _load_openai_api_key() -> str | None:
     return os.getenv("OPENAI_API_KEY")
 
@@ -55,7 +78,7 @@ def _parse_iso_date(value: str | None) -> date | None:
 def _pdf_to_base64_images(pdf_path: str, max_pages: int = 2) -> list[str]:
     encoded: list[str] = []
     fitz = import_module("fitz")
-    with fitz.open(pdf_path) as doc:
+    with _RENDER_LOCK, fitz.open(pdf_path) as doc:
         for page_index in range(min(max_pages, len(doc))):
             page = doc.load_page(page_index)
             pix = page.get_pixmap(dpi=200)
@@ -63,6 +86,55 @@ def _pdf_to_base64_images(pdf_path: str, max_pages: int = 2) -> list[str]:
     return encoded
 
 
+def _payload_cache_key(pdf_path: str) -> str | None:
+    try:
+        pdf_digest = hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+    return f"{pdf_digest}-{LLM_MODEL}-{_PROMPT_DIGEST}"
+
+
+def _payload_cache_dir() -> Path | None:
+    cache_dir = os.getenv("CERT_BOT_LLM_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else None
+
+
+def _remember_payload(cache_key: str, payload: dict) -> None:
+    # Batch workers store payloads concurrently; evict and insert atomically.
+    with _PAYLOAD_CACHE_LOCK:
+        if cache_key not in _PAYLOAD_CACHE and len(_PAYLOAD_CACHE) >= _PAYLOAD_CACHE_MAX:
+            _PAYLOAD_CACHE.pop(next(iter(_PAYLOAD_CACHE)))
+        _PAYLOAD_CACHE[cache_key] = payload
+
+
+def _load_cached_payload(cache_key: str) -> dict | None:
+    payload = _PAYLOAD_CACHE.get(cache_key)
+    if payload is not None:
+        return payload
+
+    cache_dir = _payload_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        payload = json.loads((cache_dir / f"{cache_key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    _remember_payload(cache_key, payload)
+    return payload
+
+
+def _store_cached_payload(cache_key: str, payload: dict) -> None:
+    _remember_payload(cache_key, payload)
+    cache_dir = _payload_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{cache_key}.json").write_text(json.dumps(payload), encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Could not write LLM cache entry %s: %s", cache_key, exc)
+
+
 def _fallback_regex_from_pdf(pdf_path: str) -> ExtractedFields:
     extraction = extract_text_from_pdf(pdf_path)
     raw_text = extraction.get("text", "")
@@ -76,9 +148,86 @@ def _fallback_regex_from_pdf(pdf_path: str) -> ExtractedFields:
     return fields
 
 
-def extract_fields_via_llm(pdf_path: str, fallback_to_regex: bool = True) -> ExtractedFields:
-    """Extract certificate fields via GPT-4o vision, with regex fallback on API failure."""
+def _extract_from_template(pdf_path: str) -> ExtractedFields | None:
+    """Parse a born-digital certificate of a recognized form without the LLM.
+
+    Returns None unless pdfplumber produced the text, the form number matched
+    outright, and the regex pass filled every required field the template lists.
+    signature_present is left to the pipeline's image-based detector.
+    """
+    # pdfplumber only: this runs on batch worker threads, where OCR would
+    # render with PyMuPDF outside _RENDER_LOCK and nest another thread pool.
+    extraction = extract_digital_text(pdf_path)
+    if extraction is None:
+        return None
+
+    raw_text = extraction.get("text", "")
+    form_type, confidence = identify_form_type(raw_text)
+    if confidence < _TEMPLATE_MIN_CONFIDENCE:
+        return None
+    template = load_config("form_templates.json").get("forms", {}).get(form_type.name)
+    if not template:
+        return None
+
+    fields = extract_fields_regex(raw_text, form_type)
+    fields.exemption_states = extract_exemption_states(raw_text, form_type)
+    for field_name in template.get("required_fields", []):
+        if field_name != "signature_present" and not getattr(fields, field_name, None):
+            return None
+
+    fields.form_type_detected = form_type
+    fields.raw_text = raw_text
+    fields.extraction_confidence = confidence
+    return fields
+
+
+def _fields_from_payload(payload: dict) -> ExtractedFields:
+    form_type = map_llm_form_type(payload.get("form_type", ""))
+    jurisdiction_state = normalize_state(payload.get("state") or "")
+
+    return ExtractedFields(
+        purchaser_name=payload.get("customer_name"),
+        purchaser_address=payload.get("customer_address"),
+        purchaser_state=jurisdiction_state or None,
+        purchaser_tax_id=payload.get("tax_id"),
+        purchaser_fein=payload.get("tax_id"),
+        permit_number=payload.get("tax_id"),
+        account_number=payload.get("tax_id"),
+        seller_name=payload.get("seller_name"),
+        exemption_reason=payload.get("exemption_reason"),
+        signature_present=payload.get("has_signature"),
+        cert_date=_parse_iso_date(payload.get("signed_date")),
+        expiration_date=_parse_iso_date(payload.get("expiration_date")),
+        form_type_detected=form_type,
+        exemption_states=[jurisdiction_state] if jurisdiction_state else [],
+        raw_text=payload.get("notes"),
+        extraction_confidence=float(payload.get("confidence") or 0.0),
+    )
+
+
+def extract_fields_via_llm(
+    pdf_path: str,
+    fallback_to_regex: bool = True,
+    template_first: bool = False,
+) -> ExtractedFields:
+    """Extract certificate fields via GPT-4o vision, with regex fallback on API failure.
+
+    With template_first, digital PDFs of a confidently identified form whose
+    required fields all parse by regex skip the API call entirely.
+    """
     try:
+        cache_key = _payload_cache_key(pdf_path)
+        if cache_key is not None:
+            payload = _load_cached_payload(cache_key)
+            if payload is not None:
+                return _fields_from_payload(payload)
+
+        if template_first:
+            fields = _extract_from_template(pdf_path)
+            if fields is not None:
+                logger.info("Template match for %s (%s), skipping LLM", pdf_path, fields.form_type_detected.name)
+                return fields
+
         api_key = _load_openai_api_key()
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY not configured")
@@ -100,7 +249,7 @@ def extract_fields_via_llm(pdf_path: str, fallback_to_regex: bool = True) -> Ext
             )
 
         response = client.chat.completions.create(
-            model="gpt-4o",
+            model=LLM_MODEL,
             messages=[{"role": "user", "content": content}],
             response_format={"type": "json_object"},
             temperature=0,
@@ -108,30 +257,47 @@ def extract_fields_via_llm(pdf_path: str, fallback_to_regex: bool = True) -> Ext
         message_content = response.choices[0].message.content or "{}"
         payload = json.loads(message_content)
 
-        form_type = map_llm_form_type(payload.get("form_type", ""))
-        jurisdiction_state = normalize_state(payload.get("state") or "")
-
-        fields = ExtractedFields(
-            purchaser_name=payload.get("customer_name"),
-            purchaser_address=payload.get("customer_address"),
-            purchaser_state=jurisdiction_state or None,
-            purchaser_tax_id=payload.get("tax_id"),
-            purchaser_fein=payload.get("tax_id"),
-            permit_number=payload.get("tax_id"),
-            account_number=payload.get("tax_id"),
-            seller_name=payload.get("seller_name"),
-            exemption_reason=payload.get("exemption_reason"),
-            signature_present=payload.get("has_signature"),
-            cert_date=_parse_iso_date(payload.get("signed_date")),
-            expiration_date=_parse_iso_date(payload.get("expiration_date")),
-            form_type_detected=form_type,
-            exemption_states=[jurisdiction_state] if jurisdiction_state else [],
-            raw_text=payload.get("notes"),
-            extraction_confidence=float(payload.get("confidence") or 0.0),
-        )
+        fields = _fields_from_payload(payload)
+        if cache_key is not None:
+            _store_cached_payload(cache_key, payload)
         return fields
     except Exception as exc:
         if not fallback_to_regex:
             raise
         logger.warning("LLM extraction failed, falling back to regex parsing: %s", exc)
         return _fallback_regex_from_pdf(pdf_path)
+
+
+def extract_fields_via_llm_batch(
+    pdf_paths: list[str],
+    max_concurrency: int = 8,
+    fallback_to_regex: bool = True,
+    template_first: bool = False,
+) -> list[ExtractedFields]:
+    """Extract fields for several PDFs, running up to max_concurrency API calls at once.
+
+    Results are returned in input order. Regex fallbacks run after the pool drains,
+    so OCR never overlaps with page rendering.
+    """
+
+    def attempt(pdf_path: str) -> tuple[ExtractedFields | None, Exception | None]:
+        try:
+            return extract_fields_via_llm(pdf_path, fallback_to_regex=False, template_first=template_first), None
+        except Exception as exc:
+            return None, exc
+
+    if not pdf_paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(pdf_paths)))) as pool:
+        attempts = list(pool.map(attempt, pdf_paths))
+
+    results: list[ExtractedFields] = []
+    for pdf_path, (fields, exc) in zip(pdf_paths, attempts):
+        if fields is None:
+            if not fallback_to_regex:
+                raise exc
+            logger.warning("LLM extraction failed for %s, falling back to regex parsing: %s", pdf_path, exc)
+            fields = _fallback_regex_from_pdf(pdf_path)
+        results.append(fields)
+    return results
@@ -1,3 +1,9 @@
+import hashlib
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from importlib import import_module
 from io import BytesIO
 from pathlib import Path
@@ -6,6 +12,17 @@ from PIL import Image
 
 from .models import ExtractedFields
 
+# Readable extractions keyed by the SHA-256 of the PDF bytes. The same file is
+# extracted more than once per run (ingest, then the regex fallback in
+# extract_llm), and batch folders often repeat the same certificate.
+_TEXT_CACHE_MAX = 256
+_TEXT_CACHE: dict[str, dict] = {}
+# Batch extraction fills the cache from worker threads; eviction and insert
+# must happen as one step.
+_TEXT_CACHE_LOCK = threading.Lock()
+
+_OCR_MAX_WORKERS = os.cpu_count() or 1
+
 
 def extract_text_from_pdf(pdf_path: str) -> dict:
     """
@@ -33,12 +50,57 @@ def extract_text_from_pdf(pdf_path: str) -> dict:
             "confidence": 0.0,
         }
 
+    pdf_bytes = path.read_bytes()
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    cached = _TEXT_CACHE.get(digest)
+    if cached is not None:
+        return {**cached, "pages": list(cached["pages"])}
+
+    result = _extract_text(pdf_bytes)
+    if result["method"] != "unreadable":
+        _remember_text(digest, result)
+    return result
+
+
+def _remember_text(digest: str, result: dict) -> None:
+    entry = {**result, "pages": list(result["pages"])}
+    with _TEXT_CACHE_LOCK:
+        if digest not in _TEXT_CACHE and len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))
+        _TEXT_CACHE[digest] = entry
+
+
+def extract_digital_text(pdf_path: str) -> dict | None:
+    """
+    Extract text from a born-digital PDF with pdfplumber only.
+
+    Returns the same dict as extract_text_from_pdf when pdfplumber finds at
+    least 50 characters, otherwise None. Never renders pages or runs OCR, so
+    it is safe to call from worker threads.
+    """
+    try:
+        pdf_bytes = Path(pdf_path).read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    cached = _TEXT_CACHE.get(digest)
+    if cached is not None:
+        return {**cached, "pages": list(cached["pages"])} if cached["method"] == "pdfplumber" else None
+
+    result = _extract_plumber_text(pdf_bytes)
+    if result["method"] != "pdfplumber":
+        return None
+    _remember_text(digest, result)
+    return result
+
+
+def _extract_plumber_text(pdf_bytes: bytes) -> dict:
     plumber_pages: list[str] = []
     page_count = 0
 
     try:
         pdfplumber = import_module("pdfplumber")
-        with pdfplumber.open(path) as pdf:
+        with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
             page_count = len(pdf.pages)
             for page in pdf.pages:
                 plumber_pages.append(page.extract_text() or "")
@@ -46,26 +108,34 @@ def extract_text_from_pdf(pdf_path: str) -> dict:
         plumber_pages = []
 
     plumber_text = "\n\n".join(plumber_pages).strip()
-    if len(plumber_text) >= 50:
-        return {
-            "text": plumber_text,
-            "pages": plumber_pages,
-            "page_count": page_count,
-            "method": "pdfplumber",
-            "confidence": 1.0,
-        }
+    readable = len(plumber_text) >= 50
+    return {
+        "text": plumber_text,
+        "pages": plumber_pages,
+        "page_count": page_count,
+        "method": "pdfplumber" if readable else "unreadable",
+        "confidence": 1.0 if readable else 0.0,
+    }
+
+
+def _extract_text(pdf_bytes: bytes) -> dict:
+    plumber = _extract_plumber_text(pdf_bytes)
+    if plumber["method"] == "pdfplumber":
+        return plumber
+    plumber_pages = plumber["pages"]
+    plumber_text = plumber["text"]
+    page_count = plumber["page_count"]
 
     ocr_pages: list[str] = []
     ocr_page_count = page_count
     try:
         pytesseract = import_module("pytesseract")
         fitz = import_module("fitz")
-        with fitz.open(path) as doc:
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
             ocr_page_count = len(doc)
-            for page in doc:
-                pix = page.get_pixmap(dpi=200)
-                image = Image.open(BytesIO(pix.tobytes("png")))
-                ocr_pages.append(pytesseract.image_to_string(image) or "")
+            # Rendered lazily so only the pages waiting on OCR are held in memory.
+            images = (Image.open(BytesIO(page.get_pixmap(dpi=200).tobytes("png"))) for page in doc)
+            ocr_pages = [text or "" for text in _ocr_images(pytesseract, images, ocr_page_count)]
     except Exception:
         ocr_pages = []
 
@@ -89,6 +159,28 @@ def extract_text_from_pdf(pdf_path: str) -> dict:
     }
 
 
+def _ocr_images(pytesseract, images: Iterable, page_count: int) -> list[str]:
+    """OCR rendered pages, running multi-page documents concurrently.
+
+    pytesseract shells out to the tesseract binary, so threads overlap the
+    per-page subprocesses without contending on the GIL. Pages are pulled from
+    images in the caller's thread, because PyMuPDF documents are not
+    thread-safe, and no more than one page per worker is alive at a time.
+    """
+    if page_count <= 1:
+        return [pytesseract.image_to_string(image) for image in images]
+    workers = min(page_count, _OCR_MAX_WORKERS)
+    texts: list[str] = []
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for image in images:
+            pending.append(pool.submit(pytesseract.image_to_string, image))
+            if len(pending) >= workers:
+                texts.append(pending.popleft().result())
+        texts.extend(future.result() for future in pending)
+    return texts
+
+
 def detect_signature(pdf_path: str, page_num: int = 0, region: str = "bottom_20_percent") -> bool:
     """
     Detect if a signature-like mark exists in the expected region.
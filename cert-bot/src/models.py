@@ -2,7 +2,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FormType(str, Enum):
@@ -111,6 +111,8 @@ class CheckSeverity(str, Enum):
 class CheckResult(BaseModel):
     """Result of a single validation check."""
 
+    model_config = ConfigDict(frozen=True)
+
     check_name: str
     passed: bool
     severity: CheckSeverity
@@ -1,5 +1,6 @@
 import re
 from datetime import date
+from functools import lru_cache
 
 from .models import EntityType, ExtractedFields, FormType
 from .utils import load_config, normalize_state, parse_date
@@ -91,9 +92,15 @@ def _merge_labels(custom_labels: list[str] | None, default_labels: list[str]) ->
     return merged
 
 
+@lru_cache(maxsize=None)
+def _form_code_pattern(code: str) -> re.Pattern[str]:
+    return re.compile(rf"(?<![a-z0-9]){re.escape(code)}(?![a-z0-9])")
+
+
 def _has_form_code(text: str, code: str) -> bool:
-    escaped = re.escape(code.lower())
-    return re.search(rf"(?<![a-z0-9]){escaped}(?![a-z0-9])", text) is not None
+    code = code.lower()
+    # The substring test rejects absent codes without the per-position lookbehind scan.
+    return code in text and _form_code_pattern(code).search(text) is not None
 
 def identify_form_type(raw_text: str) -> tuple[FormType, float]:
     """Identify the certificate form type from extracted text."""
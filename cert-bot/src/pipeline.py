@@ -6,7 +6,7 @@ from .classify import check_entity_form_compatibility, classify_entity, route_to
 from .disposition import build_validation_result, determine_disposition
 from .extract_llm import extract_fields_via_llm
 from .ingest import extract_certificate
-from .models import CheckResult, CheckSeverity
+from .models import CheckResult, CheckSeverity, ExtractedFields
 from .parse import parse_certificate
 from .validate import run_all_checks
 
@@ -18,9 +18,15 @@ def _resolve_state(state: str | None, extracted_state: str | None) -> str:
     return (state or extracted_state or "").strip().upper() or "UNKNOWN"
 
 
-def validate_certificate(pdf_path: str, state: str = None):
+def validate_certificate(pdf_path: str, state: str = None, llm_fields: ExtractedFields | None = None):
+    """Validate one certificate PDF.
+
+    Batch callers can pass llm_fields from extract_fields_via_llm_batch to skip
+    the per-file LLM round-trip.
+    """
     extracted = extract_certificate(pdf_path)
-    llm_fields = extract_fields_via_llm(pdf_path)
+    if llm_fields is None:
+        llm_fields = extract_fields_via_llm(pdf_path)
 
     if llm_fields.extraction_confidence >= 0.5:
         parsed = llm_fields
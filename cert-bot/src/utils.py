@@ -1,6 +1,7 @@
 import json
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -115,10 +116,15 @@ _STATE_MAP = {
 }
 
 
+@lru_cache(maxsize=None)
 def load_config(config_name: str) -> dict:
     """
     Load a JSON config file from the config/ directory.
 
+    Parsed configs are cached for the life of the process, so callers share
+    the returned dict and must not mutate it. Use load_config.cache_clear()
+    to pick up edits to the files.
+
     Args:
         config_name: filename (e.g., "state_rules.json")
     Returns:
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 import re
+import string
+import sys
+import threading
+import unicodedata
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
 
 from .models import (
     CheckResult,
@@ -43,12 +52,325 @@ _FORM_STATE_MAP: dict[FormType, str] = {
     FormType.NY_GOV_LETTER: "NY",
 }
 
-_FEDERAL_FORMS = {
-    FormType.FEDERAL_SF_1094,
-    FormType.FEDERAL_GSA_CARD,
-    FormType.FEDERAL_LETTERHEAD,
+# Keys of the per-form entries under a "form_specific" expiration rule.
+_EXPIRATION_FORM_KEYS: dict[FormType, str] = {
+    FormType.MD_GOV_1: "GOV-1",
+    FormType.MD_NONGOV_1: "NONGOV-1",
+    FormType.MA_ST_2: "ST-2",
+    FormType.MA_ST_5: "ST-5",
+    FormType.TN_GOV: "gov",
+    FormType.TN_EXEMPT_ORG: "exempt_org",
 }
 
+_FEDERAL_FORMS = frozenset({FormType.FEDERAL_SF_1094, FormType.FEDERAL_GSA_CARD, FormType.FEDERAL_LETTERHEAD})
+
+# Pathways where the purchaser fills in the form and the completeness checks apply.
+_SELF_COMPLETED_PATHWAYS = frozenset({ValidationPathway.STANDARD_SELF_COMPLETED, ValidationPathway.MULTI_STATE_UNIFORM})
+
+_GENERIC_SELLER_NAMES = frozenset({"seller", "vendor", "vendor name", "seller name"})
+
+_GOV_ENTITIES = frozenset(
+    {EntityType.FEDERAL_GOVERNMENT, EntityType.STATE_GOVERNMENT, EntityType.LOCAL_GOVERNMENT, EntityType.TRIBAL}
+)
+_EXEMPT_ORG_ENTITIES = frozenset(
+    {EntityType.NONPROFIT_501C3, EntityType.EXEMPT_ORG_OTHER, EntityType.RELIGIOUS, EntityType.EDUCATIONAL}
+)
+
+# (entity type, exemption category) -> (mismatch reason, whether it is a government wrong-box note).
+# Any pair not listed is not considered a mismatch.
+_MISMATCH_TABLE: dict[tuple[EntityType, ExemptionCategory], tuple[str, bool]] = {
+    **{
+        (entity, category): (
+            "Government entity appears to have selected an inapplicable manufacturing/agriculture exemption box.",
+            True,
+        )
+        for entity in _GOV_ENTITIES
+        for category in (ExemptionCategory.MANUFACTURING, ExemptionCategory.AGRICULTURE)
+    },
+    **{
+        (entity, ExemptionCategory.RESALE): ("Nonprofit entity claiming resale is unusual and should be reviewed.", False)
+        for entity in _EXEMPT_ORG_ENTITIES
+    },
+    (EntityType.FOR_PROFIT, ExemptionCategory.GOVERNMENT): (
+        "For-profit entity appears to claim a government exemption.",
+        False,
+    ),
+}
+
+_ENTITY_INDICATORS = (
+    "llc", "inc", "corp", "ltd", "lp", "llp", "co", "company", "department",
+    "city of", "county of", "district", "authority", "board", "commission",
+    "foundation", "association", "university", "college", "church", "temple",
+    "services", "solutions", "group", "holdings", "enterprise", "tribe", "tribal",
+    "esd", "isd", "school", "state of", "town of", "village of", "parish",
+)
+# Deliberately unanchored: indicators match anywhere in the lowered name, so
+# "corporation", "incorporated" and plurals like "enterprises" still count.
+_ENTITY_INDICATORS_RE = re.compile("|".join(re.escape(indicator) for indicator in _ENTITY_INDICATORS))
+# Two or three capitalized alphabetic tokens and nothing else, e.g. "Mary Ann Jones".
+_PERSONAL_NAME_RE = re.compile(r"[A-Z][a-zA-Z'\-.]*(?:\s+[A-Z][a-zA-Z'\-.]*){1,2}")
+
+# One scan per state: the state ID pattern and its registration wording are alternatives.
+_STATE_REGISTRATION_RE: dict[str, re.Pattern[str]] = {
+    "PA": re.compile(r"\bPA\s*[-#:]?\s*[A-Z0-9]{4,}\b|SALES\s+AND\s+USE\s+TAX\s+LICENSE"),
+    "MD": re.compile(r"\bMD\s*[-#:]?\s*[A-Z0-9]{4,}\b|REGISTRATION\s+NUMBER"),
+}
+_GENERIC_ID_RE = re.compile(r"\b[A-Z0-9-]{6,}\b")
+
+_RESALE_TIER_ORDER = (
+    ("TIER_1_STRONG", "STRONG", True, CheckSeverity.INFO),
+    ("TIER_2_PLAUSIBLE", "PLAUSIBLE", True, CheckSeverity.INFO),
+    ("TIER_3_WEAK", "WEAK", False, CheckSeverity.REASONABLENESS),
+    ("TIER_4_IMPLAUSIBLE", "IMPLAUSIBLE", False, CheckSeverity.REASONABLENESS),
+)
+
+# Group names are ExemptionCategory member names ("gov" also covers "government").
+_CATEGORY_KEYWORD_RE = re.compile(r"(?P<RESALE>resale)|(?P<GOVERNMENT>gov)|(?P<NONPROFIT>nonprofit|501)")
+
+# Smallest whole-day ages that reach 3, 4 and 5 years at 365.25 days per year.
+_CERT_AGE_LIMIT_DAYS = (1096, 1461, 1827)
+
+# CheckResult is frozen, so results that never vary are built once and shared.
+_PURCHASER_ENTITY_RESULT = CheckResult(
+    check_name="completeness.purchaser_name_is_entity",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Purchaser name appears to be an entity.",
+)
+_PURCHASER_ADDRESS_RESULT = CheckResult(
+    check_name="completeness.purchaser_address",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Purchaser address present.",
+)
+_SIGNATURE_RESULT = CheckResult(
+    check_name="completeness.signature",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Signature present.",
+)
+_FEDERAL_FORM_RESULT = CheckResult(
+    check_name="form_correctness.form_state_match",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Federal form accepted in all states.",
+)
+_FUTURE_DATE_RESULT = CheckResult(
+    check_name="expiration.future_date",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Certificate date is not in the future.",
+)
+_CERT_AGE_RESULT = CheckResult(
+    check_name="expiration.cert_age",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Certificate age within 0-3 years.",
+)
+_RESALE_TIER_DEFAULT_RESULT = CheckResult(
+    check_name="reasonableness.resale_tier",
+    passed=False,
+    severity=CheckSeverity.REASONABLENESS,
+    message="Resale tier=WEAK by default (no known resale pattern matched); conservative human review required.",
+    field="business_type",
+    recommendation="Confirm customer has a genuine SaaS resale channel.",
+)
+_ENTITY_EXEMPTION_MATCH_RESULT = CheckResult(
+    check_name="reasonableness.entity_exemption_match",
+    passed=True,
+    severity=CheckSeverity.INFO,
+    message="Entity type and exemption category are not obviously mismatched.",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ValidationConfig:
+    """Config subtrees read by the checks, loaded once instead of per certificate."""
+
+    seller_variants: frozenset[str]
+    mtc_resale_only_messages: dict[str, str]
+    mtc_registration_required_states: dict[str, dict]
+    sst_member_states: frozenset[str]
+    expiration_rules: dict
+    expiration_table: dict[tuple[str, FormType], tuple[Mapping[str, Any], str]]
+    cert_age_results: tuple[CheckResult, ...]
+    saas_validity_rules: dict
+    resale_tier_re: re.Pattern[str] | None
+    resale_tier_patterns: tuple[tuple[str, str, bool, CheckSeverity, str | None], ...]
+    wrong_box_rules: dict
+    saas_taxability_results: dict[str, CheckResult]
+
+
+def _compile_resale_tiers(
+    tiers: dict,
+) -> tuple[re.Pattern[str] | None, tuple[tuple[str, str, bool, CheckSeverity, str | None], ...]]:
+    """
+    Compile every resale tier pattern into one case-folded alternation.
+
+    Alternatives are ordered by tier, then by position in the tier's pattern list,
+    and group N of the regex corresponds to entry N-1 of the returned tuple. The
+    alternation sits inside a lookahead so overlapping patterns are all seen.
+    """
+    entries: list[tuple[str, str, bool, CheckSeverity, str | None]] = []
+    for key, label, passed, severity in _RESALE_TIER_ORDER:
+        cfg = tiers.get(key, {})
+        recommendation = cfg.get("note") or cfg.get("review_note")
+        for pattern in cfg.get("patterns", []):
+            entries.append((label, pattern, passed, severity, recommendation))
+
+    if not entries:
+        return None, ()
+    alternatives = "|".join(f"({re.escape(pattern.lower())})" for _, pattern, _, _, _ in entries)
+    return re.compile(f"(?=(?:{alternatives}))"), tuple(entries)
+
+
+def _saas_taxability_result(state: str, record: dict) -> CheckResult:
+    if record.get("no_sales_tax"):
+        return CheckResult(
+            check_name="info.saas_taxability",
+            passed=True,
+            severity=CheckSeverity.INFO,
+            message=f"{state} has no sales tax.",
+        )
+
+    if record.get("taxable") is False:
+        note = f" {record.get('note')}" if record.get("note") else ""
+        return CheckResult(
+            check_name="info.saas_taxability",
+            passed=True,
+            severity=CheckSeverity.INFO,
+            message=f"SaaS is not taxable in {state}. Certificate on file as insurance but may not be required.{note}",
+        )
+
+    if record.get("taxable") is True:
+        rate = record.get("rate", "state rate")
+        return CheckResult(
+            check_name="info.saas_taxability",
+            passed=True,
+            severity=CheckSeverity.INFO,
+            message=f"SaaS is taxable in {state} at {rate}. Certificate IS required for exempt transactions.",
+        )
+
+    return CheckResult(
+        check_name="info.saas_taxability",
+        passed=True,
+        severity=CheckSeverity.INFO,
+        message=f"SaaS taxability not found for {state}; verify state treatment manually.",
+    )
+
+
+def _build_expiration_rule(rules: dict, state: str, form_type: FormType) -> tuple[Mapping[str, Any], str]:
+    if form_type in _FEDERAL_FORMS:
+        return MappingProxyType(rules.get("FEDERAL", {"rule": "never"})), "FEDERAL"
+
+    state_rule = rules.get(state, rules.get("DEFAULT", {"rule": "never"}))
+    rule = state_rule.get("rule", "never")
+
+    if rule != "form_specific":
+        return MappingProxyType(state_rule), state
+
+    forms = state_rule.get("forms", {})
+    selected = forms.get(_EXPIRATION_FORM_KEYS.get(form_type, ""), {"rule": "never"})
+    merged = {**state_rule, **selected}
+    return MappingProxyType(merged), f"{state}:{_EXPIRATION_FORM_KEYS.get(form_type, 'default')}"
+
+
+def _cert_age_results(notes: dict) -> tuple[CheckResult, ...]:
+    """Results for each age band in _CERT_AGE_LIMIT_DAYS order, plus the 5+ year band last."""
+    bands = (
+        ("3_to_4_years", "Renewal recommended within next year", "Consider requesting renewal in next cycle."),
+        ("4_to_5_years", "Certificate aging; request updated cert", "Request refreshed certificate."),
+        (
+            "5_plus_years",
+            "Certificate is 5+ years old; best practice is to obtain updated documentation",
+            "Obtain updated documentation as best practice.",
+        ),
+    )
+    flagged = tuple(
+        CheckResult(
+            check_name="expiration.cert_age",
+            passed=False,
+            severity=CheckSeverity.SOFT_FLAG,
+            message=notes.get(key, {}).get("note", default_note),
+            recommendation=recommendation,
+        )
+        for key, default_note, recommendation in bands
+    )
+    return (_CERT_AGE_RESULT, *flagged)
+
+
+def _load_validation_config() -> _ValidationConfig:
+    reasonableness = load_config("reasonableness_rules.json")
+    state_rules = load_config("state_rules.json")
+    mtc_rules = load_config("mtc_restrictions.json")
+
+    seller_cfg = reasonableness.get("seller_name_variants", {})
+    seller_variants = seller_cfg.get("exact_matches", []) + seller_cfg.get("acceptable_variants", [])
+
+    # The correction message only varies by state, so render it once per resale-only state.
+    template = mtc_rules.get("correction_template", "MTC restricted in {state}.")
+    resale_only_messages = {
+        state: template.format(
+            state=state,
+            alternative_forms=", ".join(rule.get("alternative_forms", [])) or "state-specific forms",
+        )
+        for state, rule in mtc_rules.get("resale_only_states", {}).items()
+        if isinstance(rule, dict)
+    }
+
+    resale_tier_re, resale_tier_patterns = _compile_resale_tiers(reasonableness.get("resale_tiers", {}))
+
+    # Resolve every configured state against every form up front; the merged
+    # form-specific rules are read-only views shared by all callers.
+    expiration_rules = state_rules.get("expiration_rules", {})
+    expiration_table = {
+        (state, form_type): _build_expiration_rule(expiration_rules, state, form_type)
+        for state, rule in expiration_rules.items()
+        if isinstance(rule, dict)
+        for form_type in FormType
+    }
+
+    return _ValidationConfig(
+        seller_variants=frozenset(s.lower() for s in seller_variants),
+        mtc_resale_only_messages=resale_only_messages,
+        mtc_registration_required_states=mtc_rules.get("registration_required_states", {}),
+        sst_member_states=frozenset(state_rules.get("sst_member_states", [])),
+        expiration_rules=expiration_rules,
+        expiration_table=expiration_table,
+        cert_age_results=_cert_age_results(state_rules.get("cert_age_flags", {})),
+        saas_validity_rules=reasonableness.get("exemption_validity_for_saas", {}),
+        resale_tier_re=resale_tier_re,
+        resale_tier_patterns=resale_tier_patterns,
+        wrong_box_rules=reasonableness.get("wrong_box_rules", {}),
+        # CheckResult is frozen, so one prebuilt result per state can be handed out to every caller.
+        saas_taxability_results={
+            state: _saas_taxability_result(state, record)
+            for state, record in state_rules.get("taxability", {}).items()
+            if isinstance(record, dict)
+        },
+    )
+
+
+_CFG = _load_validation_config()
+
+
+def reload_config() -> None:
+    """Re-read the JSON rule files (e.g. after editing them in tests) and drop cached pipelines."""
+    global _CFG
+    load_config.cache_clear()
+    _CFG = _load_validation_config()
+    _PIPELINE_CACHE.clear()
+
+
+CheckPipeline = Callable[[ExtractedFields, EntityType], list[CheckResult]]
+
+# State keys come from OCR/LLM output, so garbled values would otherwise pile up
+# for the life of a batch run. Real (state, form, pathway) combinations fit well
+# under the bound; the oldest entry is dropped once it is reached.
+_PIPELINE_CACHE_MAX = 1024
+_PIPELINE_CACHE: dict[tuple[str, FormType, ValidationPathway], CheckPipeline] = {}
+_PIPELINE_CACHE_LOCK = threading.Lock()
+
 
 def run_all_checks(
     fields: ExtractedFields,
@@ -58,38 +380,100 @@ def run_all_checks(
     state: str,
 ) -> list[CheckResult]:
     """Run all validation checks in sequence and return results."""
-    results: list[CheckResult | None] = []
-
-    results.append(check_purchaser_name(fields))
-    results.append(check_purchaser_name_is_entity(fields))
-    results.append(check_purchaser_address(fields, pathway))
-    results.append(check_seller_name(fields, pathway))
-    results.append(check_exemption_reason(fields, pathway))
-    results.append(check_signature(fields, pathway))
-    results.append(check_date(fields, pathway))
-    results.append(check_exemption_state(fields, state))
-    results.append(check_compound_failure([r for r in results if r is not None]))
-
-    results.append(check_form_correct_for_state(form_type, state))
-    results.append(check_mtc_resale_only(fields, form_type, state))
-    results.append(check_sst_member(form_type, state))
-    results.append(check_state_specific_requirements(fields, form_type, state))
-
-    results.append(check_expiration(fields, state, form_type))
-    results.append(check_future_date(fields))
-    results.append(check_cert_age(fields))
-
-    results.append(check_exemption_for_saas(fields, entity_type, state))
-    if _derive_exemption_category(fields) == ExemptionCategory.RESALE:
-        results.append(check_resale_tier(fields, entity_type))
-    results.append(check_entity_exemption_match(fields, entity_type, state))
-    results.append(check_saas_taxability(state))
+    normalized_state = (state or "").strip().upper()
+    return make_pipeline(normalized_state, form_type, pathway)(fields, entity_type)
 
-    return [r for r in results if r is not None]
 
+def make_pipeline(state: str, form_type: FormType, pathway: ValidationPathway) -> CheckPipeline:
+    """
+    Build the check sequence for one (state, form type, pathway) combination.
 
-def check_purchaser_name(fields: ExtractedFields) -> CheckResult:
-    if not fields.purchaser_name or len(fields.purchaser_name.strip()) < 2:
+    Everything that depends only on those three inputs is decided once here:
+    which checks can apply at all, the resolved expiration rule, and the results
+    of the checks that never look at the certificate fields. The returned
+    function runs the remaining checks in the same order as run_all_checks.
+    Pipelines are cached, so a batch of same-state certificates builds one.
+    """
+    key = (state, form_type, pathway)
+    cached = _PIPELINE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    self_completed = pathway in _SELF_COMPLETED_PATHWAYS
+    is_mtc = form_type == FormType.MTC_UNIFORM
+    runs_state_specific = (
+        (state in {"PA", "MD"} and is_mtc) or (state == "MA" and form_type == FormType.MA_ST_2) or state == "TX"
+    )
+    expiration_state = state or "DEFAULT"
+    expiration_rule, expiration_source = _resolve_expiration_rule(expiration_state, form_type)
+
+    # With a known state the exemption-state check never looks at the certificate.
+    exemption_state_result = check_exemption_state(ExtractedFields(), state) if state else None
+    form_state_result = check_form_correct_for_state(form_type, state)
+    sst_result = check_sst_member(form_type, state)
+    saas_taxability_result = check_saas_taxability(state)
+
+    def pipeline(fields: ExtractedFields, entity_type: EntityType) -> list[CheckResult]:
+        purchaser_name = _clean(fields.purchaser_name)
+        results = [check_purchaser_name(fields, purchaser_name), check_purchaser_name_is_entity(fields, purchaser_name)]
+        if self_completed:
+            results.append(check_purchaser_address(fields, pathway))
+            results.append(check_seller_name(fields, pathway))
+            results.append(check_exemption_reason(fields, pathway))
+            results.append(check_signature(fields, pathway))
+            results.append(check_date(fields, pathway))
+        results.append(exemption_state_result or check_exemption_state(fields, state))
+
+        hard_fail_count = 0
+        for result in results:
+            if not result.passed and result.severity == CheckSeverity.HARD_FAIL:
+                hard_fail_count += 1
+        compound = _compound_failure_result(hard_fail_count)
+        if compound is not None:
+            results.append(compound)
+
+        if form_state_result is not None:
+            results.append(form_state_result)
+        category = _derive_exemption_category(fields)
+        if is_mtc:
+            results.append(check_mtc_resale_only(fields, form_type, state, category))
+        if sst_result is not None:
+            results.append(sst_result)
+        if runs_state_specific:
+            state_specific = check_state_specific_requirements(fields, form_type, state)
+            if state_specific is not None:
+                results.append(state_specific)
+
+        # One clock read per certificate keeps the date checks consistent with each other.
+        today = date.today()
+        results.append(_expiration_result(fields, expiration_state, expiration_rule, expiration_source, today))
+        if fields.cert_date:
+            results.append(check_future_date(fields, today))
+            results.append(check_cert_age(fields, today))
+
+        if category is not None:
+            results.append(check_exemption_for_saas(fields, entity_type, state, category))
+            if category == ExemptionCategory.RESALE:
+                results.append(check_resale_tier(fields, entity_type, category))
+            results.append(check_entity_exemption_match(fields, entity_type, state, category))
+        results.append(saas_taxability_result)
+        return results
+
+    with _PIPELINE_CACHE_LOCK:
+        if key not in _PIPELINE_CACHE and len(_PIPELINE_CACHE) >= _PIPELINE_CACHE_MAX:
+            _PIPELINE_CACHE.pop(next(iter(_PIPELINE_CACHE)))
+        _PIPELINE_CACHE[key] = pipeline
+    return pipeline
+
+
+def _clean(value: str | None) -> str:
+    return (value or "").strip()
+
+
+def check_purchaser_name(fields: ExtractedFields, name: str | None = None) -> CheckResult:
+    if name is None:
+        name = _clean(fields.purchaser_name)
+    if len(name) < 2:
         return CheckResult(
             check_name="completeness.purchaser_name",
             passed=False,
@@ -106,8 +490,9 @@ def check_purchaser_name(fields: ExtractedFields) -> CheckResult:
     )
 
 
-def check_purchaser_name_is_entity(fields: ExtractedFields) -> CheckResult:
-    name = (fields.purchaser_name or "").strip()
+def check_purchaser_name_is_entity(fields: ExtractedFields, name: str | None = None) -> CheckResult:
+    if name is None:
+        name = _clean(fields.purchaser_name)
     if not name:
         return CheckResult(
             check_name="completeness.purchaser_name_is_entity",
@@ -118,27 +503,10 @@ def check_purchaser_name_is_entity(fields: ExtractedFields) -> CheckResult:
             recommendation="Provide full legal entity name.",
         )
 
-    entity_indicators = [
-        "llc", "inc", "corp", "ltd", "lp", "llp", "co", "company", "department",
-        "city of", "county of", "district", "authority", "board", "commission",
-        "foundation", "association", "university", "college", "church", "temple",
-        "services", "solutions", "group", "holdings", "enterprise", "tribe", "tribal",
-        "esd", "isd", "school", "state of", "town of", "village of", "parish",
-    ]
+    if _ENTITY_INDICATORS_RE.search(name.lower()):
+        return _PURCHASER_ENTITY_RESULT
 
-    lower = name.lower()
-    if any(ind in lower for ind in entity_indicators):
-        return CheckResult(
-            check_name="completeness.purchaser_name_is_entity",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message="Purchaser name appears to be an entity.",
-        )
-
-    parts = [p for p in re.split(r"\s+", name) if p]
-    alpha_parts = [p for p in parts if re.fullmatch(r"[A-Za-z][A-Za-z'\-.]*", p)]
-    cap_pattern = all(re.fullmatch(r"[A-Z][a-zA-Z'\-.]*", p) for p in alpha_parts) if alpha_parts else False
-    if len(alpha_parts) in {2, 3} and len(alpha_parts) == len(parts) and cap_pattern:
+    if _PERSONAL_NAME_RE.fullmatch(name):
         return CheckResult(
             check_name="completeness.purchaser_name_is_entity",
             passed=False,
@@ -159,7 +527,7 @@ def check_purchaser_name_is_entity(fields: ExtractedFields) -> CheckResult:
 
 
 def check_purchaser_address(fields: ExtractedFields, pathway: ValidationPathway) -> CheckResult | None:
-    if pathway not in {ValidationPathway.STANDARD_SELF_COMPLETED, ValidationPathway.MULTI_STATE_UNIFORM}:
+    if pathway not in _SELF_COMPLETED_PATHWAYS:
         return None
 
     if not fields.purchaser_address or len(fields.purchaser_address.strip()) < 5:
@@ -171,19 +539,14 @@ def check_purchaser_address(fields: ExtractedFields, pathway: ValidationPathway)
             field="purchaser_address",
             recommendation="Provide purchaser street/city/state address.",
         )
-    return CheckResult(
-        check_name="completeness.purchaser_address",
-        passed=True,
-        severity=CheckSeverity.INFO,
-        message="Purchaser address present.",
-    )
+    return _PURCHASER_ADDRESS_RESULT
 
 
 def check_seller_name(fields: ExtractedFields, pathway: ValidationPathway) -> CheckResult | None:
-    if pathway not in {ValidationPathway.STANDARD_SELF_COMPLETED, ValidationPathway.MULTI_STATE_UNIFORM}:
+    if pathway not in _SELF_COMPLETED_PATHWAYS:
         return None
 
-    seller = (fields.seller_name or "").strip()
+    seller = _clean(fields.seller_name)
     if not seller:
         return CheckResult(
             check_name="completeness.seller_name",
@@ -194,11 +557,9 @@ def check_seller_name(fields: ExtractedFields, pathway: ValidationPathway) -> Ch
             recommendation="Certificate must identify seller/vendor name.",
         )
 
-    cfg = load_config("reasonableness_rules.json").get("seller_name_variants", {})
-    accepted = {s.lower() for s in cfg.get("exact_matches", []) + cfg.get("acceptable_variants", [])}
     lower = seller.lower()
 
-    if lower in accepted:
+    if lower in _CFG.seller_variants:
         return CheckResult(
             check_name="completeness.seller_name",
             passed=True,
@@ -214,7 +575,7 @@ def check_seller_name(fields: ExtractedFields, pathway: ValidationPathway) -> Ch
             message=f"Seller name contains Fleetio/Rarestep reference: {seller}",
         )
 
-    if lower in {"seller", "vendor", "vendor name", "seller name"}:
+    if lower in _GENERIC_SELLER_NAMES:
         return CheckResult(
             check_name="completeness.seller_name",
             passed=False,
@@ -245,7 +606,7 @@ def check_seller_name(fields: ExtractedFields, pathway: ValidationPathway) -> Ch
 
 
 def check_exemption_reason(fields: ExtractedFields, pathway: ValidationPathway) -> CheckResult | None:
-    if pathway not in {ValidationPathway.STANDARD_SELF_COMPLETED, ValidationPathway.MULTI_STATE_UNIFORM}:
+    if pathway not in _SELF_COMPLETED_PATHWAYS:
         return None
 
     if not fields.exemption_reason or len(fields.exemption_reason.strip()) < 3:
@@ -266,7 +627,7 @@ def check_exemption_reason(fields: ExtractedFields, pathway: ValidationPathway)
 
 
 def check_signature(fields: ExtractedFields, pathway: ValidationPathway) -> CheckResult | None:
-    if pathway not in {ValidationPathway.STANDARD_SELF_COMPLETED, ValidationPathway.MULTI_STATE_UNIFORM}:
+    if pathway not in _SELF_COMPLETED_PATHWAYS:
         return None
 
     if not fields.signature_present:
@@ -279,16 +640,11 @@ def check_signature(fields: ExtractedFields, pathway: ValidationPathway) -> Chec
             recommendation="Signed certificate required for self-completed forms.",
         )
 
-    return CheckResult(
-        check_name="completeness.signature",
-        passed=True,
-        severity=CheckSeverity.INFO,
-        message="Signature present.",
-    )
+    return _SIGNATURE_RESULT
 
 
 def check_date(fields: ExtractedFields, pathway: ValidationPathway) -> CheckResult | None:
-    if pathway not in {ValidationPathway.STANDARD_SELF_COMPLETED, ValidationPathway.MULTI_STATE_UNIFORM}:
+    if pathway not in _SELF_COMPLETED_PATHWAYS:
         return None
 
     if not fields.cert_date:
@@ -339,6 +695,10 @@ def check_exemption_state(fields: ExtractedFields, state: str) -> CheckResult:
 
 def check_compound_failure(previous_results: list[CheckResult]) -> CheckResult | None:
     hard_fail_count = sum(1 for r in previous_results if (not r.passed and r.severity == CheckSeverity.HARD_FAIL))
+    return _compound_failure_result(hard_fail_count)
+
+
+def _compound_failure_result(hard_fail_count: int) -> CheckResult | None:
     if hard_fail_count >= 3:
         return CheckResult(
             check_name="completeness.compound_failure",
@@ -356,12 +716,7 @@ def check_form_correct_for_state(form_type: FormType, state: str) -> CheckResult
         return None
 
     if form_type in _FEDERAL_FORMS:
-        return CheckResult(
-            check_name="form_correctness.form_state_match",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message="Federal form accepted in all states.",
-        )
+        return _FEDERAL_FORM_RESULT
 
     if form_type == FormType.MTC_UNIFORM:
         return CheckResult(
@@ -401,58 +756,61 @@ def _derive_exemption_category(fields: ExtractedFields) -> ExemptionCategory | N
     if fields.exemption_category:
         return fields.exemption_category
 
-    reason = (fields.exemption_reason or "").lower()
-    if "resale" in reason:
-        return ExemptionCategory.RESALE
-    if "government" in reason or "gov" in reason:
-        return ExemptionCategory.GOVERNMENT
-    if "nonprofit" in reason or "501" in reason:
-        return ExemptionCategory.NONPROFIT
-    return None
+    # One scan over the reason; keywords keep their precedence (resale > government > nonprofit)
+    # regardless of where they appear in the text.
+    found: ExemptionCategory | None = None
+    for match in _CATEGORY_KEYWORD_RE.finditer((fields.exemption_reason or "").lower()):
+        category = ExemptionCategory[match.lastgroup]
+        if category is ExemptionCategory.RESALE:
+            return category
+        if found is None or category is ExemptionCategory.GOVERNMENT:
+            found = category
+    return found
 
 
 def _has_state_registration(fields: ExtractedFields, state: str) -> bool:
-    haystack = " ".join(
+    pattern = _STATE_REGISTRATION_RE.get(state, _GENERIC_ID_RE)
+    id_text = " ".join(
         [
             fields.purchaser_tax_id or "",
             fields.purchaser_fein or "",
             fields.account_number or "",
             fields.permit_number or "",
-            fields.raw_text or "",
         ]
     ).upper()
+    if pattern.search(id_text):
+        return True
+    if not fields.raw_text:
+        return False
 
-    if state == "PA":
-        return bool(re.search(r"\bPA\s*[-#:]?\s*[A-Z0-9]{4,}\b", haystack)) or bool(
-            re.search(r"SALES\s+AND\s+USE\s+TAX\s+LICENSE", haystack)
-        )
-    if state == "MD":
-        return bool(re.search(r"\bMD\s*[-#:]?\s*[A-Z0-9]{4,}\b", haystack)) or bool(
-            re.search(r"REGISTRATION\s+NUMBER", haystack)
-        )
-    return bool(re.search(r"\b[A-Z0-9-]{6,}\b", haystack))
+    # Only upper-case and scan the (possibly multi-page OCR) raw text when the ID
+    # fields alone don't carry the number; keep them in front so matches spanning
+    # the join are still found.
+    return pattern.search(f"{id_text} {fields.raw_text.upper()}") is not None
 
 
-def check_mtc_resale_only(fields: ExtractedFields, form_type: FormType, state: str) -> CheckResult | None:
+def check_mtc_resale_only(
+    fields: ExtractedFields,
+    form_type: FormType,
+    state: str,
+    category: ExemptionCategory | None = None,
+) -> CheckResult | None:
     if form_type != FormType.MTC_UNIFORM:
         return None
 
     normalized_state = (state or "").strip().upper()
-    rules = load_config("mtc_restrictions.json")
-    resale_only_states = rules.get("resale_only_states", {})
-    registration_required_states = rules.get("registration_required_states", {})
+    registration_required_states = _CFG.mtc_registration_required_states
 
-    if normalized_state in resale_only_states:
-        category = _derive_exemption_category(fields)
+    resale_only_message = _CFG.mtc_resale_only_messages.get(normalized_state)
+    if resale_only_message is not None:
+        if category is None:
+            category = _derive_exemption_category(fields)
         if category != ExemptionCategory.RESALE:
-            alt_forms = resale_only_states[normalized_state].get("alternative_forms", [])
-            template = rules.get("correction_template", "MTC restricted in {state}.")
-            message = template.format(state=normalized_state, alternative_forms=", ".join(alt_forms) or "state-specific forms")
             return CheckResult(
                 check_name="form_correctness.mtc_resale_only",
                 passed=False,
                 severity=CheckSeverity.HARD_FAIL,
-                message=message,
+                message=resale_only_message,
                 recommendation="Resubmit on approved form for non-resale exemption.",
             )
 
@@ -479,8 +837,7 @@ def check_sst_member(form_type: FormType, state: str) -> CheckResult | None:
         return None
 
     normalized_state = (state or "").strip().upper()
-    sst_members = set(load_config("state_rules.json").get("sst_member_states", []))
-    if normalized_state not in sst_members:
+    if normalized_state not in _CFG.sst_member_states:
         alternative = _FORM_STATE_MAP.get(FormType.TX_01_339, "a state-specific form") if normalized_state == "TX" else "a state-specific form"
         return CheckResult(
             check_name="form_correctness.sst_member",
@@ -500,6 +857,11 @@ def check_sst_member(form_type: FormType, state: str) -> CheckResult | None:
     )
 
 
+def _mentions_501c3_letter(raw_text: str) -> bool:
+    lowered = raw_text.lower()
+    return "501(c)(3)" in lowered or "determination letter" in lowered
+
+
 def check_state_specific_requirements(fields: ExtractedFields, form_type: FormType, state: str) -> CheckResult | None:
     normalized_state = (state or "").strip().upper()
 
@@ -521,16 +883,14 @@ def check_state_specific_requirements(fields: ExtractedFields, form_type: FormTy
             recommendation="Provide MD registration number.",
         )
 
-    if normalized_state == "MA" and form_type == FormType.MA_ST_2:
-        txt = (fields.raw_text or "").lower()
-        if "501(c)(3)" not in txt and "determination letter" not in txt:
-            return CheckResult(
-                check_name="state_specific.ma_st2_501c3_letter",
-                passed=False,
-                severity=CheckSeverity.SOFT_FLAG,
-                message="MA ST-2 generally supported by IRS 501(c)(3) determination letter; not found in packet.",
-                recommendation="Request determination letter if not already on file.",
-            )
+    if normalized_state == "MA" and form_type == FormType.MA_ST_2 and not _mentions_501c3_letter(fields.raw_text or ""):
+        return CheckResult(
+            check_name="state_specific.ma_st2_501c3_letter",
+            passed=False,
+            severity=CheckSeverity.SOFT_FLAG,
+            message="MA ST-2 generally supported by IRS 501(c)(3) determination letter; not found in packet.",
+            recommendation="Request determination letter if not already on file.",
+        )
 
     if normalized_state == "TX" and fields.exemption_category == ExemptionCategory.GOVERNMENT:
         return CheckResult(
@@ -543,34 +903,17 @@ def check_state_specific_requirements(fields: ExtractedFields, form_type: FormTy
     return None
 
 
-def _resolve_expiration_rule(state: str, form_type: FormType) -> tuple[dict, str]:
-    rules = load_config("state_rules.json").get("expiration_rules", {})
-
-    if form_type in _FEDERAL_FORMS:
-        return rules.get("FEDERAL", {"rule": "never"}), "FEDERAL"
-
-    state_rule = rules.get(state, rules.get("DEFAULT", {"rule": "never"}))
-    rule = state_rule.get("rule", "never")
-
-    if rule != "form_specific":
-        return state_rule, state
-
-    forms = state_rule.get("forms", {})
-    key_map = {
-        FormType.MD_GOV_1: "GOV-1",
-        FormType.MD_NONGOV_1: "NONGOV-1",
-        FormType.MA_ST_2: "ST-2",
-        FormType.MA_ST_5: "ST-5",
-        FormType.TN_GOV: "gov",
-        FormType.TN_EXEMPT_ORG: "exempt_org",
-    }
-    selected = forms.get(key_map.get(form_type, ""), {"rule": "never"})
-    merged = {**state_rule, **selected}
-    return merged, f"{state}:{key_map.get(form_type, 'default')}"
+def _resolve_expiration_rule(state: str, form_type: FormType) -> tuple[Mapping[str, Any], str]:
+    resolved = _CFG.expiration_table.get((state, form_type))
+    if resolved is None:
+        # States without a rule of their own fall back to DEFAULT, reported under their own name.
+        resolved = _build_expiration_rule(_CFG.expiration_rules, state, form_type)
+    return resolved
 
 
-def _date_window_result(check_name: str, expiration: date, state: str, citation: str | None) -> CheckResult:
-    today = date.today()
+def _date_window_result(
+    check_name: str, expiration: date, state: str, citation: str | None, today: date
+) -> CheckResult:
     cite_suffix = f" Citation: {citation}." if citation else ""
     if today > expiration:
         return CheckResult(
@@ -596,9 +939,17 @@ def _date_window_result(check_name: str, expiration: date, state: str, citation:
     )
 
 
-def check_expiration(fields: ExtractedFields, state: str, form_type: FormType) -> CheckResult:
+def check_expiration(
+    fields: ExtractedFields, state: str, form_type: FormType, today: date | None = None
+) -> CheckResult:
     normalized_state = (state or "").strip().upper() or "DEFAULT"
     rule_cfg, rule_source = _resolve_expiration_rule(normalized_state, form_type)
+    return _expiration_result(fields, normalized_state, rule_cfg, rule_source, today or date.today())
+
+
+def _expiration_result(
+    fields: ExtractedFields, normalized_state: str, rule_cfg: Mapping[str, Any], rule_source: str, today: date
+) -> CheckResult:
     rule = rule_cfg.get("rule", "never")
     citation = rule_cfg.get("citation")
 
@@ -627,7 +978,7 @@ def check_expiration(fields: ExtractedFields, state: str, form_type: FormType) -
             expiration = cert_date.replace(year=cert_date.year + years)
         except ValueError:
             expiration = cert_date.replace(month=2, day=28, year=cert_date.year + years)
-        return _date_window_result("expiration.state_rule", expiration, normalized_state, citation)
+        return _date_window_result("expiration.state_rule", expiration, normalized_state, citation, today)
 
     if rule in {"state_printed", "period_cert"}:
         if not fields.expiration_date:
@@ -639,7 +990,7 @@ def check_expiration(fields: ExtractedFields, state: str, form_type: FormType) -
                 field="expiration_date",
                 recommendation="Capture printed expiration date from certificate.",
             )
-        return _date_window_result("expiration.state_rule", fields.expiration_date, normalized_state, citation)
+        return _date_window_result("expiration.state_rule", fields.expiration_date, normalized_state, citation, today)
 
     return CheckResult(
         check_name="expiration.state_rule",
@@ -649,10 +1000,10 @@ def check_expiration(fields: ExtractedFields, state: str, form_type: FormType) -
     )
 
 
-def check_future_date(fields: ExtractedFields) -> CheckResult | None:
+def check_future_date(fields: ExtractedFields, today: date | None = None) -> CheckResult | None:
     if not fields.cert_date:
         return None
-    if fields.cert_date > date.today():
+    if fields.cert_date > (today or date.today()):
         return CheckResult(
             check_name="expiration.future_date",
             passed=False,
@@ -661,66 +1012,33 @@ def check_future_date(fields: ExtractedFields) -> CheckResult | None:
             field="cert_date",
             recommendation="Use actual execution date; pre-dated certificates are invalid.",
         )
-    return CheckResult(
-        check_name="expiration.future_date",
-        passed=True,
-        severity=CheckSeverity.INFO,
-        message="Certificate date is not in the future.",
-    )
+    return _FUTURE_DATE_RESULT
 
 
-def check_cert_age(fields: ExtractedFields) -> CheckResult | None:
+def check_cert_age(fields: ExtractedFields, today: date | None = None) -> CheckResult | None:
     if not fields.cert_date:
         return None
 
-    age_years = (date.today() - fields.cert_date).days / 365.25
-    notes = load_config("state_rules.json").get("cert_age_flags", {})
-
-    if age_years < 3:
-        return CheckResult(
-            check_name="expiration.cert_age",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message="Certificate age within 0-3 years.",
-        )
-    if age_years < 4:
-        return CheckResult(
-            check_name="expiration.cert_age",
-            passed=False,
-            severity=CheckSeverity.SOFT_FLAG,
-            message=notes.get("3_to_4_years", {}).get("note", "Renewal recommended within next year"),
-            recommendation="Consider requesting renewal in next cycle.",
-        )
-    if age_years < 5:
-        return CheckResult(
-            check_name="expiration.cert_age",
-            passed=False,
-            severity=CheckSeverity.SOFT_FLAG,
-            message=notes.get("4_to_5_years", {}).get("note", "Certificate aging; request updated cert"),
-            recommendation="Request refreshed certificate.",
-        )
-    return CheckResult(
-        check_name="expiration.cert_age",
-        passed=False,
-        severity=CheckSeverity.SOFT_FLAG,
-        message=notes.get("5_plus_years", {}).get(
-            "note", "Certificate is 5+ years old; best practice is to obtain updated documentation"
-        ),
-        recommendation="Obtain updated documentation as best practice.",
-    )
+    days = ((today or date.today()) - fields.cert_date).days
+    results = _CFG.cert_age_results
+    for limit, result in zip(_CERT_AGE_LIMIT_DAYS, results):
+        if days < limit:
+            return result
+    return results[-1]
 
 
 def check_exemption_for_saas(
     fields: ExtractedFields,
     entity_type: EntityType,
     state: str,
+    category: ExemptionCategory | None = None,
 ) -> CheckResult | None:
-    rules = load_config("reasonableness_rules.json").get("exemption_validity_for_saas", {})
-    category = _derive_exemption_category(fields)
+    if category is None:
+        category = _derive_exemption_category(fields)
     if category is None:
         return None
 
-    category_cfg = rules.get(category.name, {})
+    category_cfg = _CFG.saas_validity_rules.get(category.name, {})
     state_upper = (state or "").strip().upper()
 
     if category in {ExemptionCategory.GOVERNMENT, ExemptionCategory.NONPROFIT, ExemptionCategory.DIRECT_PAY}:
@@ -780,82 +1098,59 @@ def check_exemption_for_saas(
 def check_resale_tier(
     fields: ExtractedFields,
     entity_type: EntityType,
+    category: ExemptionCategory | None = None,
 ) -> CheckResult | None:
-    if _derive_exemption_category(fields) != ExemptionCategory.RESALE:
+    if category is None:
+        category = _derive_exemption_category(fields)
+    if category != ExemptionCategory.RESALE:
         return None
 
-    tiers = load_config("reasonableness_rules.json").get("resale_tiers", {})
     text = " ".join(filter(None, [fields.business_type, fields.purchaser_name])).lower()
 
-    tier_map = [
-        ("TIER_1_STRONG", "STRONG", True, CheckSeverity.INFO),
-        ("TIER_2_PLAUSIBLE", "PLAUSIBLE", True, CheckSeverity.INFO),
-        ("TIER_3_WEAK", "WEAK", False, CheckSeverity.REASONABLENESS),
-        ("TIER_4_IMPLAUSIBLE", "IMPLAUSIBLE", False, CheckSeverity.REASONABLENESS),
-    ]
-
-    for key, label, passed, severity in tier_map:
-        cfg = tiers.get(key, {})
-        for pattern in cfg.get("patterns", []):
-            if pattern.lower() in text:
-                outcome = "accepted" if passed else "flagged for review"
-                return CheckResult(
-                    check_name="reasonableness.resale_tier",
-                    passed=passed,
-                    severity=severity,
-                    message=f"Resale tier={label} based on pattern '{pattern}' in purchaser profile; claim {outcome}.",
-                    field="business_type",
-                    recommendation=cfg.get("note") or cfg.get("review_note"),
-                )
+    # Each match is the highest-priority pattern starting at that position, so the
+    # lowest group index overall is the first tier (then first pattern) that occurs.
+    # Group 1 cannot be beaten, so the scan stops as soon as it is seen.
+    best = None
+    if _CFG.resale_tier_re is not None:
+        for match in _CFG.resale_tier_re.finditer(text):
+            if best is None or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:
+                    break
+
+    if best is not None:
+        label, pattern, passed, severity, recommendation = _CFG.resale_tier_patterns[best - 1]
+        outcome = "accepted" if passed else "flagged for review"
+        return CheckResult(
+            check_name="reasonableness.resale_tier",
+            passed=passed,
+            severity=severity,
+            message=f"Resale tier={label} based on pattern '{pattern}' in purchaser profile; claim {outcome}.",
+            field="business_type",
+            recommendation=recommendation,
+        )
 
-    return CheckResult(
-        check_name="reasonableness.resale_tier",
-        passed=False,
-        severity=CheckSeverity.REASONABLENESS,
-        message="Resale tier=WEAK by default (no known resale pattern matched); conservative human review required.",
-        field="business_type",
-        recommendation="Confirm customer has a genuine SaaS resale channel.",
-    )
+    return _RESALE_TIER_DEFAULT_RESULT
 
 
 def check_entity_exemption_match(
     fields: ExtractedFields,
     entity_type: EntityType,
     state: str,
+    category: ExemptionCategory | None = None,
 ) -> CheckResult | None:
-    category = _derive_exemption_category(fields)
+    if category is None:
+        category = _derive_exemption_category(fields)
     if category is None:
         return None
 
-    cfg = load_config("reasonableness_rules.json")
-    mismatches = cfg.get("wrong_box_rules", {})
-    state_rules = load_config("state_rules.json")
-    sst_states = set(state_rules.get("sst_member_states", []))
-
-    state_upper = (state or "").strip().upper()
-    is_sst = state_upper in sst_states
-    sev = CheckSeverity.SOFT_FLAG if is_sst else CheckSeverity.REASONABLENESS
-
-    gov_entities = {EntityType.FEDERAL_GOVERNMENT, EntityType.STATE_GOVERNMENT, EntityType.LOCAL_GOVERNMENT, EntityType.TRIBAL}
-    mismatch_reason: str | None = None
-
-    if entity_type in gov_entities and category in {ExemptionCategory.MANUFACTURING, ExemptionCategory.AGRICULTURE}:
-        mismatch_reason = "Government entity appears to have selected an inapplicable manufacturing/agriculture exemption box."
-        sev = CheckSeverity.INFO
-    elif entity_type in {EntityType.NONPROFIT_501C3, EntityType.EXEMPT_ORG_OTHER, EntityType.RELIGIOUS, EntityType.EDUCATIONAL} and category == ExemptionCategory.RESALE:
-        mismatch_reason = "Nonprofit entity claiming resale is unusual and should be reviewed."
-    elif entity_type == EntityType.FOR_PROFIT and category == ExemptionCategory.GOVERNMENT:
-        mismatch_reason = "For-profit entity appears to claim a government exemption."
+    mismatch = _MISMATCH_TABLE.get((entity_type, category))
+    if mismatch is None:
+        return _ENTITY_EXEMPTION_MATCH_RESULT
+    mismatch_reason, government_note = mismatch
 
-    if not mismatch_reason:
-        return CheckResult(
-            check_name="reasonableness.entity_exemption_match",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message="Entity type and exemption category are not obviously mismatched.",
-        )
-
-    if sev == CheckSeverity.INFO:
+    if government_note:
+        mismatches = _CFG.wrong_box_rules
         return CheckResult(
             check_name="reasonableness.entity_exemption_match",
             passed=False,
@@ -864,6 +1159,9 @@ def check_entity_exemption_match(
             recommendation=mismatches.get("government_wrong_box", {}).get("note") if isinstance(mismatches, dict) else None,
         )
 
+    state_upper = (state or "").strip().upper()
+    is_sst = state_upper in _CFG.sst_member_states
+    sev = CheckSeverity.SOFT_FLAG if is_sst else CheckSeverity.REASONABLENESS
     review_message = "SST four-corners protections may reduce seller risk." if is_sst else "Good-faith documentation standard applies."
     return CheckResult(
         check_name="reasonableness.entity_exemption_match",
@@ -876,49 +1174,34 @@ def check_entity_exemption_match(
 
 def check_saas_taxability(state: str) -> CheckResult:
     state_upper = (state or "").strip().upper()
-    taxability = load_config("state_rules.json").get("taxability", {})
-    record = taxability.get(state_upper, {})
+    result = _CFG.saas_taxability_results.get(state_upper)
+    if result is None:
+        return _saas_taxability_result(state_upper, {})
+    return result
 
-    if record.get("no_sales_tax"):
-        return CheckResult(
-            check_name="info.saas_taxability",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message=f"{state_upper} has no sales tax.",
-        )
 
-    if record.get("taxable") is False:
-        note = f" {record.get('note')}" if record.get("note") else ""
-        return CheckResult(
-            check_name="info.saas_taxability",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message=f"SaaS is not taxable in {state_upper}. Certificate on file as insurance but may not be required.{note}",
-        )
 
-    if record.get("taxable") is True:
-        rate = record.get("rate", "state rate")
-        return CheckResult(
-            check_name="info.saas_taxability",
-            passed=True,
-            severity=CheckSeverity.INFO,
-            message=f"SaaS is taxable in {state_upper} at {rate}. Certificate IS required for exempt transactions.",
-        )
-
-    return CheckResult(
-        check_name="info.saas_taxability",
-        passed=True,
-        severity=CheckSeverity.INFO,
-        message=f"SaaS taxability not found for {state_upper}; verify state treatment manually.",
-    )
+_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits)
 
+# str.translate table for ASCII input: keep a-z/0-9, map whitespace to a space, drop everything else.
+_NAME_TRANSLATION = {
+    codepoint: codepoint if chr(codepoint) in _NAME_CHARS else (" " if chr(codepoint).isspace() else None)
+    for codepoint in range(128)
+}
 
 
+# Portfolios repeat the same customer across many certs, and reports re-run
+# duplicate detection over freshly dumped results, so normalized names are memoized
+# by their raw value rather than stashed on the (throwaway) result dicts.
+@lru_cache(maxsize=4096)
 def _normalize_name(value: str | None) -> str:
     if not value:
         return ""
-    cleaned = re.sub(r"[^a-z0-9\s]", "", value.lower())
-    return re.sub(r"\s+", " ", cleaned).strip()
+    if not value.isascii():
+        # Fold accents and compatibility forms (e.g. "École", non-breaking spaces) to ASCII
+        # before stripping punctuation, so variants of the same name share a fingerprint.
+        value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return " ".join(value.lower().translate(_NAME_TRANSLATION).split())
 
 
 def find_duplicates(results: list[dict]) -> list[tuple[str, str]]:
@@ -931,39 +1214,49 @@ def find_duplicates(results: list[dict]) -> list[tuple[str, str]]:
     - If two certs have identical fingerprints, they're duplicates
 
     For certs with no cert_date, use customer_name + state + form_type as fingerprint.
+    Certs with no usable customer_name are never fingerprinted.
 
     Returns list of tuples: (cert_id_1, cert_id_2) indicating duplicate pairs.
     Mark the NEWER cert (by cert_date or file modification date) as the duplicate.
     """
-    buckets: dict[str, list[dict]] = {}
-    for result in results:
-        customer = _normalize_name(result.get("customer_name"))
-        state = (result.get("state") or "").strip().upper()
-        exemption_category = (result.get("exemption_category") or "").strip().lower()
-        cert_date = result.get("cert_date") or result.get("expiration_date") or ""
-        form_type = (result.get("form_type") or "").strip()
+    if len(results) < 2:
+        return []
+
+    buckets: dict[tuple[str, ...], list[tuple[str, int, dict]]] = {}
+    for index, result in enumerate(results):
+        get = result.get
+        customer = _normalize_name(get("customer_name"))
+        if not customer:
+            continue
+        # A handful of distinct states/categories recur across every record; interning
+        # lets fingerprint equality checks on bucket lookup short-circuit on identity.
+        state = sys.intern((get("state") or "").strip().upper())
+        exemption_category = sys.intern((get("exemption_category") or "").strip().lower())
+        cert_date = get("cert_date") or get("expiration_date") or ""
+        form_type = (get("form_type") or "").strip()
 
         if cert_date:
-            fingerprint = f"{customer}|{state}|{exemption_category}|{cert_date}"
+            fingerprint = (customer, state, exemption_category, str(cert_date))
         else:
-            fingerprint = f"{customer}|{state}|{form_type}"
+            fingerprint = (customer, state, form_type)
 
-        buckets.setdefault(fingerprint, []).append(result)
+        # The input index breaks sort-key ties in arrival order and keeps
+        # the comparison from ever reaching the result dicts themselves.
+        sort_key = str(get("cert_date") or get("validated_at") or "")
+        buckets.setdefault(fingerprint, []).append((sort_key, index, result))
 
     duplicates: list[tuple[str, str]] = []
     for bucket in buckets.values():
         if len(bucket) < 2:
             continue
-
-        def sort_key(item: dict):
-            date_marker = item.get("cert_date") or item.get("validated_at") or ""
-            return str(date_marker)
-
-        sorted_bucket = sorted(bucket, key=sort_key)
-        canonical = sorted_bucket[0]
-        canonical_id = str(canonical.get("cert_id") or canonical.get("avalara_cert_id") or "unknown")
-        for duplicate in sorted_bucket[1:]:
-            dup_id = str(duplicate.get("cert_id") or duplicate.get("avalara_cert_id") or "unknown")
-            duplicates.append((canonical_id, dup_id))
+        bucket.sort()
+        canonical_id = None
+        for _, _, result in bucket:
+            get = result.get
+            record_id = str(get("cert_id") or get("avalara_cert_id") or "unknown")
+            if canonical_id is None:
+                canonical_id = record_id
+            else:
+                duplicates.append((canonical_id, record_id))
 
     return duplicates
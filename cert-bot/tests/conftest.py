@@ -1,4 +1,31 @@
 import os
 import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def fixture_pdfs():
+    """Fixture certificate PDFs, globbed once per test session."""
+    pdfs = list(FIXTURES.glob("*.pdf"))
+    if not pdfs:
+        pytest.skip("No test PDFs found in fixtures/")
+    return pdfs
+
+
+@pytest.fixture(scope="session")
+def extract_fixture():
+    """Text extraction for a fixture PDF, run on first request and cached for the session."""
+    from src.ingest import extract_text_from_pdf
+
+    @lru_cache(maxsize=None)
+    def extract(pdf: Path) -> dict:
+        return extract_text_from_pdf(str(pdf))
+
+    return extract
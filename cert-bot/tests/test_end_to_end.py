@@ -21,13 +21,9 @@ def test_clean_cert_validates():
     assert result.confidence_score > 50
 
 
-def test_pipeline_returns_all_fields():
+def test_pipeline_returns_all_fields(fixture_pdfs):
     """Pipeline should populate all key fields."""
-    pdfs = list(FIXTURES.glob("*.pdf"))
-    if not pdfs:
-        pytest.skip("No test PDFs")
-
-    result = validate_certificate(str(pdfs[0]))
+    result = validate_certificate(str(fixture_pdfs[0]))
     assert result.customer_name is not None or result.form_type is not None
     assert result.disposition is not None
     assert result.confidence_score >= 0
@@ -1,8 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from pathlib import Path
 from types import SimpleNamespace
 import sys
 
-from src.extract_llm import extract_fields_via_llm
+from PIL import Image
+
+from src import extract_llm
+from src.extract_llm import extract_fields_via_llm, extract_fields_via_llm_batch
 from src.models import EntityType, FormType
 from src.parse import map_llm_entity_type, map_llm_form_type
 
@@ -86,3 +91,145 @@ def test_map_llm_entity_type_variants():
 
     for value, expected in cases.items():
         assert map_llm_entity_type(value) == expected
+
+
+def test_extract_fields_via_llm_reuses_response_for_same_pdf(monkeypatch, tmp_path):
+    payload = '{"customer_name":"Travis County ESD 2","state":"TX","form_type":"TX 01-339","confidence":0.88}'
+    calls = []
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=payload))]
+            )
+
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.chat = SimpleNamespace(completions=FakeCompletions())
+
+    monkeypatch.delenv("CERT_BOT_LLM_CACHE_DIR", raising=False)
+    monkeypatch.setattr("src.extract_llm._load_openai_api_key", lambda: "test-key")
+    monkeypatch.setattr("src.extract_llm._pdf_to_base64_images", lambda *_args, **_kwargs: ["abc123"])
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
+
+    first_pdf = tmp_path / "first.pdf"
+    first_pdf.write_bytes(b"%PDF-1.4 cache reuse test")
+    copy_pdf = tmp_path / "copy.pdf"
+    copy_pdf.write_bytes(first_pdf.read_bytes())
+
+    first = extract_fields_via_llm(str(first_pdf))
+    second = extract_fields_via_llm(str(copy_pdf))
+
+    assert len(calls) == 1
+    assert second == first
+    assert second is not first
+    assert second.purchaser_name == "Travis County ESD 2"
+
+
+def test_extract_fields_via_llm_batch_keeps_order_and_falls_back(monkeypatch, tmp_path):
+    class FakeCompletions:
+        def create(self, **kwargs):
+            name = kwargs["messages"][0]["content"][1]["image_url"]["url"].rsplit(",", 1)[1]
+            content = f'{{"customer_name":"{name}","state":"TX","confidence":0.9}}'
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.chat = SimpleNamespace(completions=FakeCompletions())
+
+    def fake_images(pdf_path, **_kwargs):
+        if "broken" in pdf_path:
+            raise RuntimeError("cannot render")
+        return [Path(pdf_path).stem]
+
+    monkeypatch.delenv("CERT_BOT_LLM_CACHE_DIR", raising=False)
+    monkeypatch.setattr("src.extract_llm._load_openai_api_key", lambda: "test-key")
+    monkeypatch.setattr("src.extract_llm._pdf_to_base64_images", fake_images)
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
+
+    paths = []
+    for name in ["alpha", "broken", "gamma"]:
+        pdf = tmp_path / f"{name}.pdf"
+        pdf.write_bytes(f"%PDF-1.4 batch {name}".encode())
+        paths.append(str(pdf))
+
+    results = extract_fields_via_llm_batch(paths, max_concurrency=3)
+
+    assert [r.purchaser_name for r in results] == ["alpha", None, "gamma"]
+    assert results[1].extraction_confidence < 0.5
+    assert extract_fields_via_llm_batch([]) == []
+
+
+def test_extract_fields_via_llm_template_first_skips_api(monkeypatch):
+    text = (
+        "Texas Sales and Use Tax Exemption Certification\n"
+        "Form 01-339 (back)\n"
+        "Name of purchaser: City of Mont Belvieu\n"
+        "Address: 11607 Eagle Dr, Mont Belvieu, TX 77580\n"
+        "Seller: Rarestep, Inc.\n"
+        "Purchaser claims this exemption for the following reason: Municipal government entity\n"
+        "Date: 01/15/2025\n"
+    )
+
+    def no_api_key():
+        raise AssertionError("template match should not reach the API")
+
+    monkeypatch.delenv("CERT_BOT_LLM_CACHE_DIR", raising=False)
+    monkeypatch.setattr("src.extract_llm._load_openai_api_key", no_api_key)
+    monkeypatch.setattr(
+        "src.extract_llm.extract_digital_text",
+        lambda _path: {"text": text, "pages": [text], "page_count": 1, "method": "pdfplumber", "confidence": 1.0},
+    )
+
+    fields = extract_fields_via_llm("template.pdf", fallback_to_regex=False, template_first=True)
+
+    assert fields.form_type_detected == FormType.TX_01_339
+    assert fields.purchaser_name == "City of Mont Belvieu"
+    assert fields.cert_date == date(2025, 1, 15)
+    assert fields.extraction_confidence >= 0.95
+
+
+def test_batch_template_probe_does_not_ocr_scanned_pdfs(monkeypatch, tmp_path):
+    class FakeCompletions:
+        def create(self, **kwargs):
+            content = '{"customer_name":"Scanned Buyer","state":"TX","confidence":0.9}'
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+            )
+
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.chat = SimpleNamespace(completions=FakeCompletions())
+
+    ocr_calls = []
+    monkeypatch.delenv("CERT_BOT_LLM_CACHE_DIR", raising=False)
+    monkeypatch.setattr("src.extract_llm._load_openai_api_key", lambda: "test-key")
+    monkeypatch.setattr("src.extract_llm._pdf_to_base64_images", lambda *_args, **_kwargs: ["abc123"])
+    monkeypatch.setattr("src.ingest._ocr_images", lambda *args: ocr_calls.append(args) or [])
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=FakeOpenAI))
+
+    # An image-only PDF has no text layer, like a scanned certificate.
+    scanned = tmp_path / "scanned.pdf"
+    Image.new("RGB", (200, 200), "white").save(scanned, "PDF")
+
+    results = extract_fields_via_llm_batch([str(scanned)], template_first=True)
+
+    assert ocr_calls == []
+    assert results[0].purchaser_name == "Scanned Buyer"
+
+
+def test_payload_cache_eviction_is_thread_safe(monkeypatch):
+    monkeypatch.setattr(extract_llm, "_PAYLOAD_CACHE", {})
+    monkeypatch.setattr(extract_llm, "_PAYLOAD_CACHE_MAX", 4)
+
+    def fill(worker: int) -> None:
+        for i in range(500):
+            extract_llm._remember_payload(f"{worker}-{i}", {})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(fill, range(8)))
+
+    assert len(extract_llm._PAYLOAD_CACHE) <= 4
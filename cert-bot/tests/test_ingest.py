@@ -1,43 +1,28 @@
-from pathlib import Path
+from types import SimpleNamespace
 
-import pytest
+from src import ingest
+from src.ingest import detect_signature, extract_certificate
 
-from src.ingest import detect_signature, extract_certificate, extract_text_from_pdf
 
-FIXTURES = Path(__file__).parent / "fixtures"
-
-
-def test_extract_text_returns_content():
+def test_extract_text_returns_content(fixture_pdfs, extract_fixture):
     """Any test cert PDF should return non-empty text."""
-    pdfs = list(FIXTURES.glob("*.pdf"))
-    if not pdfs:
-        pytest.skip("No test PDFs found in fixtures/")
-
-    for pdf in pdfs[:3]:  # Test first 3
-        result = extract_text_from_pdf(str(pdf))
+    for pdf in fixture_pdfs[:3]:  # Test first 3
+        result = extract_fixture(pdf)
         assert len(result["text"]) > 50, f"Too little text from {pdf.name}"
         assert result["method"] in ("pdfplumber", "ocr")
 
 
-def test_extract_certificate_returns_model():
+def test_extract_certificate_returns_model(fixture_pdfs):
     """extract_certificate should return a valid ExtractedFields."""
-    pdfs = list(FIXTURES.glob("*.pdf"))
-    if not pdfs:
-        pytest.skip("No test PDFs")
-
-    result = extract_certificate(str(pdfs[0]))
+    result = extract_certificate(str(fixture_pdfs[0]))
     assert result.raw_text is not None
     assert result.extraction_confidence > 0
     assert result.signature_present is not None
 
 
-def test_detect_signature_on_fixture_if_present():
+def test_detect_signature_on_fixture_if_present(fixture_pdfs):
     """Signature detector should return bool on available fixture PDFs."""
-    pdfs = list(FIXTURES.glob("*.pdf"))
-    if not pdfs:
-        pytest.skip("No test PDFs")
-
-    signature = detect_signature(str(pdfs[0]))
+    signature = detect_signature(str(fixture_pdfs[0]))
     assert isinstance(signature, bool)
 
 
@@ -58,3 +43,25 @@ def test_load_config():
 
     reason = load_config("reasonableness_rules.json")
     assert "exemption_validity_for_saas" in reason
+
+
+def test_ocr_images_bounds_pages_in_flight(monkeypatch):
+    """Multi-page OCR never holds more than one window of rendered pages."""
+    monkeypatch.setattr(ingest, "_OCR_MAX_WORKERS", 2)
+    rendered = []
+    done = []
+
+    def pages():
+        for page in range(7):
+            # Rendering the next page must not push past one page per worker.
+            assert len(rendered) - len(done) < 2
+            rendered.append(page)
+            yield page
+
+    def image_to_string(page):
+        done.append(page)
+        return f"page {page}"
+
+    texts = ingest._ocr_images(SimpleNamespace(image_to_string=image_to_string), pages(), 7)
+
+    assert texts == [f"page {page}" for page in range(7)]
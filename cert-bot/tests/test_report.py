@@ -58,6 +58,23 @@ def test_find_duplicates_identifies_matching_fingerprint():
     assert ("100", "101") in dupes
 
 
+def test_find_duplicates_folds_accents_and_nonbreaking_spaces():
+    results = [
+        {"cert_id": "200", "customer_name": "École Élémentaire", "state": "TX", "cert_date": "2024-01-01"},
+        {"cert_id": "201", "customer_name": "Ecole\u00a0Elementaire", "state": "TX", "cert_date": "2024-01-01"},
+    ]
+    assert ("200", "201") in find_duplicates(results)
+
+
+def test_find_duplicates_ignores_certs_without_customer_name():
+    results = [
+        {"cert_id": "300", "customer_name": "", "state": "TX", "form_type": "TX_01_339"},
+        {"cert_id": "301", "customer_name": None, "state": "TX", "form_type": "TX_01_339"},
+    ]
+    assert find_duplicates(results) == []
+    assert find_duplicates(results[:1]) == []
+
+
 def test_generate_portfolio_report_sections_present():
     results = [
         _sample_result("1", "Alpha", "TX", Disposition.VALIDATED, date.today()),
@@ -1,6 +1,16 @@
 from datetime import date
-
-from src.models import CheckResult, CheckSeverity, ExemptionCategory, ExtractedFields, FormType
+from functools import lru_cache
+
+from src import validate
+from src.models import (
+    CheckResult,
+    CheckSeverity,
+    EntityType,
+    ExemptionCategory,
+    ExtractedFields,
+    FormType,
+    ValidationPathway,
+)
 from src.validate import (
     check_cert_age,
     check_compound_failure,
@@ -9,6 +19,10 @@ from src.validate import (
     check_mtc_resale_only,
     check_purchaser_name_is_entity,
     check_sst_member,
+    check_state_specific_requirements,
+    make_pipeline,
+    reload_config,
+    run_all_checks,
 )
 
 
@@ -104,6 +118,16 @@ def test_sst_member_passes():
     assert result.passed is True
 
 
+def test_ma_st2_determination_letter_matches_any_case():
+    """OCR casing like 'dEtermination LETTER' still counts as a determination letter."""
+    fields = ExtractedFields(raw_text="Attached: IRS dEtermination LETTER for the purchaser")
+    assert check_state_specific_requirements(fields, FormType.MA_ST_2, "MA") is None
+
+    missing = check_state_specific_requirements(ExtractedFields(raw_text="No letter attached"), FormType.MA_ST_2, "MA")
+    assert missing is not None
+    assert missing.check_name == "state_specific.ma_st2_501c3_letter"
+
+
 def test_future_date_fails():
     """Cert with future date should fail."""
     fields = ExtractedFields(cert_date=date(2027, 6, 1), raw_text="")
@@ -119,3 +143,92 @@ def test_cert_age_flag_for_old_cert():
     assert result is not None
     assert result.passed is False
     assert result.severity == CheckSeverity.SOFT_FLAG
+
+
+def test_date_checks_use_supplied_today():
+    """Date checks evaluate against the caller's date instead of the wall clock."""
+    fields = ExtractedFields(cert_date=date(2020, 3, 1), raw_text="")
+    assert check_future_date(fields, today=date(2019, 12, 31)).passed is False
+    assert check_cert_age(fields, today=date(2021, 3, 1)).passed is True
+    assert check_cert_age(fields, today=date(2024, 3, 2)).passed is False
+
+    assert check_expiration(fields, "AL", FormType.AL_STE_1, today=date(2020, 3, 2)).passed is True
+    assert check_expiration(fields, "AL", FormType.AL_STE_1, today=date(2021, 3, 2)).severity == CheckSeverity.HARD_FAIL
+
+
+def test_make_pipeline_cached_per_key_with_expected_checks():
+    """Pipelines are cached per (state, form, pathway) and run the known TX check sequence."""
+    pipeline = make_pipeline("TX", FormType.TX_01_339, ValidationPathway.STANDARD_SELF_COMPLETED)
+    assert make_pipeline("TX", FormType.TX_01_339, ValidationPathway.STANDARD_SELF_COMPLETED) is pipeline
+
+    fields = ExtractedFields(purchaser_name="City of Austin", exemption_reason="Government entity", raw_text="")
+    checks = run_all_checks(
+        fields, FormType.TX_01_339, EntityType.LOCAL_GOVERNMENT, ValidationPathway.STANDARD_SELF_COMPLETED, " tx "
+    )
+    assert [(c.check_name, c.passed) for c in checks] == [
+        ("completeness.purchaser_name", True),
+        ("completeness.purchaser_name_is_entity", True),
+        ("completeness.purchaser_address", False),
+        ("completeness.seller_name", False),
+        ("completeness.exemption_reason", True),
+        ("completeness.signature", False),
+        ("completeness.cert_date", False),
+        ("completeness.exemption_state", True),
+        ("completeness.compound_failure", False),
+        ("form_correctness.form_state_match", True),
+        ("expiration.state_rule", True),
+        ("reasonableness.exemption_for_saas", True),
+        ("reasonableness.entity_exemption_match", True),
+        ("info.saas_taxability", True),
+    ]
+
+    pa_pipeline = make_pipeline("PA", FormType.MTC_UNIFORM, ValidationPathway.STANDARD_SELF_COMPLETED)
+    assert pa_pipeline is not pipeline
+    pa_names = [c.check_name for c in pa_pipeline(fields, EntityType.LOCAL_GOVERNMENT)]
+    assert "form_correctness.mtc_registration_required" in pa_names
+    assert "state_specific.pa_mtc_license" in pa_names
+
+
+def test_reload_config_rebuilds_snapshot_and_pipelines(monkeypatch):
+    """reload_config picks up edited rules in both the config snapshot and cached pipelines."""
+    real_load_config = validate.load_config
+
+    @lru_cache(maxsize=None)
+    def load_with_tx_in_sst(config_name):
+        cfg = real_load_config(config_name)
+        if config_name == "state_rules.json":
+            cfg = {**cfg, "sst_member_states": [*cfg["sst_member_states"], "TX"]}
+        return cfg
+
+    fields = ExtractedFields(purchaser_name="City of Austin", raw_text="")
+    pathway = ValidationPathway.STANDARD_SELF_COMPLETED
+    before = make_pipeline("TX", FormType.SST_F0003, pathway)
+    assert "TX" not in validate._CFG.sst_member_states
+
+    monkeypatch.setattr(validate, "load_config", load_with_tx_in_sst)
+    try:
+        reload_config()
+        assert "TX" in validate._CFG.sst_member_states
+        after = make_pipeline("TX", FormType.SST_F0003, pathway)
+        assert after is not before
+        sst = [c for c in after(fields, EntityType.LOCAL_GOVERNMENT) if c.check_name == "form_correctness.sst_member"]
+        assert [c.passed for c in sst] == [True]
+    finally:
+        monkeypatch.undo()
+        reload_config()
+
+    assert "TX" not in validate._CFG.sst_member_states
+    assert check_sst_member(FormType.SST_F0003, "TX").passed is False
+
+
+def test_pipeline_cache_is_bounded(monkeypatch):
+    """Garbled OCR state values cannot grow the pipeline cache without limit."""
+    monkeypatch.setattr(validate, "_PIPELINE_CACHE", {})
+    monkeypatch.setattr(validate, "_PIPELINE_CACHE_MAX", 4)
+
+    for garbled in ["T X", "7X", "TXX", "T%", "0H", "C4"]:
+        make_pipeline(garbled, FormType.MTC_UNIFORM, ValidationPathway.STANDARD_SELF_COMPLETED)
+
+    assert list(validate._PIPELINE_CACHE) == [
+        (state, FormType.MTC_UNIFORM, ValidationPathway.STANDARD_SELF_COMPLETED) for state in ["TXX", "T%", "0H", "C4"]
+    ]
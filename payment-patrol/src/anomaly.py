@@ -5,6 +5,9 @@ from decimal import Decimal
 
 from .models import Anomaly, CustomerSummary, PortfolioSummary
 
+_ONE = Decimal("1")
+_CONCENTRATION_SHARE = Decimal("0.05")
+
 
 def detect_anomalies(
     portfolio: PortfolioSummary,
@@ -25,9 +28,14 @@ def detect_anomalies(
     if portfolio.pct_past_due - prior_past_due_pct > 3:
         anomalies.append(Anomaly(type="past_due_surge", severity="red", message="Past-due percentage increased by more than 3 points week-over-week."))
 
-    total_ar = portfolio.total_ar or Decimal("1")
+    total_ar = portfolio.total_ar or _ONE
+    # With positive AR the share test is one multiply per portfolio; a net-credit
+    # portfolio would flip the inequality, so it keeps the per-customer division.
+    positive_ar = total_ar > 0
+    threshold = total_ar * _CONCENTRATION_SHARE
     for c in customers:
-        if c.total_ar / total_ar > Decimal("0.05"):
+        exceeds_share = c.total_ar > threshold if positive_ar else c.total_ar / total_ar > _CONCENTRATION_SHARE
+        if exceeds_share:
             anomalies.append(Anomaly(type="concentration_risk", severity="yellow", message=f"{c.customer_name} exceeds 5% of total AR.", customer_name=c.customer_name, amount=c.total_ar))
 
     return anomalies
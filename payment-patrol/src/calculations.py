@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from decimal import Decimal
 
 from .models import ARTransaction, CustomerSummary, PortfolioSummary
 
 
-BUCKET_ORDER = ["current", "1_30", "31_60", "61_90", "91_120", "over_120"]
+BUCKET_ORDER = ("current", "1_30", "31_60", "61_90", "91_120", "over_120")
 FORECAST_RATES = {
     "current": Decimal("0.95"),
     "1_30": Decimal("0.80"),
@@ -14,48 +15,57 @@ FORECAST_RATES = {
     "91_120": Decimal("0.20"),
     "over_120": Decimal("0.05"),
 }
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+_DSO_PERIOD_DAYS = Decimal("90")
+# Inclusive upper day bound of every bucket but the last, aligned with BUCKET_ORDER.
+_BUCKET_UPPER_DAYS = (0, 30, 60, 90, 120)
 
 
 def bucket_for_days(days_overdue: int) -> str:
-    if days_overdue <= 0:
-        return "current"
-    if days_overdue <= 30:
-        return "1_30"
-    if days_overdue <= 60:
-        return "31_60"
-    if days_overdue <= 90:
-        return "61_90"
-    if days_overdue <= 120:
-        return "91_120"
-    return "over_120"
+    return BUCKET_ORDER[bisect_left(_BUCKET_UPPER_DAYS, days_overdue)]
 
 
 def compute_portfolio_summary(transactions: list[ARTransaction], customers: list[CustomerSummary], total_invoiced_amount: Decimal | None) -> PortfolioSummary:
-    aging = {k: Decimal("0") for k in BUCKET_ORDER}
+    bucket_totals = [_ZERO] * len(BUCKET_ORDER)
+    past_due_total = _ZERO
+    past_due_weighted = _ZERO
+    intercompany = _ZERO
     for tx in transactions:
-        aging[bucket_for_days(tx.days_overdue or 0)] += tx.signed_amount_remaining
-
-    total_ar = sum(aging.values(), Decimal("0"))
+        days = tx.days_overdue or 0
+        amount = tx.signed_amount_remaining
+        bucket_totals[bisect_left(_BUCKET_UPPER_DAYS, days)] += amount
+        if days > 0 and amount > 0:
+            past_due_total += amount
+            past_due_weighted += Decimal(days) * amount
+        if "fleetio" in tx.customer_name_lc and "auto integrate" in tx.subsidiary_lc:
+            intercompany += amount
+    aging = dict(zip(BUCKET_ORDER, bucket_totals))
+
+    government_ar = _ZERO
+    commercial_ar = _ZERO
+    for c in customers:
+        if c.is_government:
+            government_ar += c.total_ar
+        else:
+            commercial_ar += c.total_ar
+
+    total_ar = sum(aging.values(), _ZERO)
     total_current = aging["current"]
     total_past_due = total_ar - total_current
-    pct_past_due = float((total_past_due / total_ar * Decimal("100")) if total_ar else Decimal("0"))
-    aging_pct = {k: float((v / total_ar * Decimal("100")) if total_ar else Decimal("0")) for k, v in aging.items()}
-
-    invoiced = total_invoiced_amount or Decimal("1")
-    dso_simple = float((total_ar / invoiced) * Decimal("90")) if total_invoiced_amount and total_invoiced_amount > 0 else 0.0
-    dso_countback = min(365.0, max(0.0, float(sum(abs(v) for v in aging.values()) / max(invoiced, Decimal("1")) * Decimal("90"))))
+    pct_past_due = float((total_past_due / total_ar * _HUNDRED) if total_ar else _ZERO)
+    aging_pct = {k: float((v / total_ar * _HUNDRED) if total_ar else _ZERO) for k, v in aging.items()}
 
-    past_due = [t for t in transactions if (t.days_overdue or 0) > 0 and t.signed_amount_remaining > 0]
-    past_due_total = sum((t.signed_amount_remaining for t in past_due), Decimal("0"))
-    wado = float(sum((Decimal(t.days_overdue or 0) * t.signed_amount_remaining for t in past_due), Decimal("0")) / past_due_total) if past_due_total else 0.0
+    invoiced = total_invoiced_amount or _ONE
+    dso_simple = float((total_ar / invoiced) * _DSO_PERIOD_DAYS) if total_invoiced_amount and total_invoiced_amount > 0 else 0.0
+    dso_countback = min(365.0, max(0.0, float(sum(abs(v) for v in aging.values()) / max(invoiced, _ONE) * _DSO_PERIOD_DAYS)))
 
-    cei = float(((invoiced - max(total_past_due, Decimal("0"))) / invoiced) * Decimal("100")) if total_invoiced_amount and invoiced > 0 else 0.0
+    wado = float(past_due_weighted / past_due_total) if past_due_total else 0.0
 
-    government_ar = sum((c.total_ar for c in customers if c.is_government), Decimal("0"))
-    commercial_ar = sum((c.total_ar for c in customers if not c.is_government), Decimal("0"))
-    intercompany = sum((t.signed_amount_remaining for t in transactions if "fleetio" in t.customer_name.lower() and "auto integrate" in t.subsidiary.lower()), Decimal("0"))
+    cei = float(((invoiced - max(total_past_due, _ZERO)) / invoiced) * _HUNDRED) if total_invoiced_amount and invoiced > 0 else 0.0
 
-    forecast = sum((aging[k] * FORECAST_RATES[k] for k in BUCKET_ORDER), Decimal("0"))
+    forecast = sum((aging[k] * FORECAST_RATES[k] for k in BUCKET_ORDER), _ZERO)
 
     health = {
         "dso_health": "green" if dso_simple <= 45 else ("yellow" if dso_simple <= 60 else "red"),
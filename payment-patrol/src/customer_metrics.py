@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from datetime import date
+from collections import defaultdict
 from decimal import Decimal
 
 from .models import ARTransaction, CustomerSummary
@@ -14,29 +13,53 @@ def build_customer_summaries(transactions: list[ARTransaction]) -> list[Customer
 
     results: list[CustomerSummary] = []
     for customer_id, txs in grouped.items():
-        sorted_txs = sorted(txs, key=lambda x: x.invoice_date)
-        invoice_count = sum(1 for t in txs if t.type == "Invoice")
-        credit_count = sum(1 for t in txs if t.type in {"Credit Memo", "Payment"})
-        total_ar = sum((t.signed_amount_remaining for t in txs), Decimal("0"))
-        total_past_due = sum((t.signed_amount_remaining for t in txs if t.type == "Invoice" and (t.days_overdue or 0) > 0), Decimal("0"))
-        oldest_invoice_date = sorted_txs[0].invoice_date if sorted_txs else date.today()
-        oldest_past_due_days = max([(t.days_overdue or 0) for t in txs] or [0])
-        mode_terms = Counter([t.effective_terms for t in txs]).most_common(1)[0][0]
+        oldest_tx = txs[0]
+        invoice_count = 0
+        credit_count = 0
+        total_ar = Decimal("0")
+        total_past_due = Decimal("0")
+        oldest_past_due_days = txs[0].days_overdue or 0
+        terms_tally: dict[int, int] = {}
+        is_government = False
+        billing_method = None
+        collection_method = None
+        for t in txs:
+            if t.invoice_date < oldest_tx.invoice_date:
+                oldest_tx = t
+            days_overdue = t.days_overdue or 0
+            total_ar += t.signed_amount_remaining
+            if t.type == "Invoice":
+                invoice_count += 1
+                if days_overdue > 0:
+                    total_past_due += t.signed_amount_remaining
+            elif t.type in {"Credit Memo", "Payment"}:
+                credit_count += 1
+            if days_overdue > oldest_past_due_days:
+                oldest_past_due_days = days_overdue
+            terms_tally[t.effective_terms] = terms_tally.get(t.effective_terms, 0) + 1
+            is_government = is_government or t.is_government
+            if billing_method is None and t.billing_method:
+                billing_method = t.billing_method
+            if collection_method is None and t.collection_method:
+                collection_method = t.collection_method
+
+        # max() keeps the first-seen terms value on ties, as Counter.most_common did.
+        mode_terms = max(terms_tally, key=terms_tally.__getitem__)
 
         results.append(
             CustomerSummary(
                 customer_internal_id=customer_id,
-                customer_name=sorted_txs[0].customer_name,
-                is_government=any(t.is_government for t in txs),
+                customer_name=oldest_tx.customer_name,
+                is_government=is_government,
                 invoice_count=invoice_count,
                 credit_memo_count=credit_count,
                 total_ar=total_ar,
                 total_past_due=total_past_due,
-                oldest_invoice_date=oldest_invoice_date,
+                oldest_invoice_date=oldest_tx.invoice_date,
                 oldest_past_due_days=oldest_past_due_days,
                 effective_terms=mode_terms,
-                billing_method=next((t.billing_method for t in txs if t.billing_method), None),
-                collection_method=next((t.collection_method for t in txs if t.collection_method), None),
+                billing_method=billing_method,
+                collection_method=collection_method,
             )
         )
 
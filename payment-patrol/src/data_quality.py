@@ -3,29 +3,38 @@ from __future__ import annotations
 from collections import defaultdict
 
 from .models import ARTransaction, DataQualityReport
+from .terms_analysis import STANDARD
+
+_STANDARD_TERMS = frozenset(STANDARD)
 
 
 def build_data_quality_report(transactions: list[ARTransaction]) -> DataQualityReport:
     report = DataQualityReport()
-    customer_has_open_invoice = defaultdict(bool)
+    customers_with_open_invoice: set[str] = set()
     name_to_ids = defaultdict(set)
+    missing_billing_seen: set[str] = set()
+    open_credits: list[ARTransaction] = []
 
     for tx in transactions:
         if tx.type == "Invoice" and tx.signed_amount_remaining > 0:
-            customer_has_open_invoice[tx.customer_internal_id] = True
+            customers_with_open_invoice.add(tx.customer_internal_id)
+        elif tx.type == "Credit Memo" and tx.amount_remaining != 0:
+            open_credits.append(tx)
         name_to_ids[tx.customer_name].add(tx.customer_internal_id)
 
-    for tx in transactions:
-        if tx.type == "Credit Memo" and tx.amount_remaining != 0 and not customer_has_open_invoice[tx.customer_internal_id]:
-            report.unapplied_credits.append({"customer_name": tx.customer_name, "credit_amount": str(tx.amount_remaining)})
         if tx.is_government and not tx.po_number:
             report.gov_no_po.append({"customer_name": tx.customer_name, "document_number": tx.document_number})
-        if not tx.billing_method and not tx.collection_method:
-            if tx.customer_name not in report.missing_billing_method:
-                report.missing_billing_method.append(tx.customer_name)
-        if tx.calculated_terms is not None and tx.calculated_terms not in [0, 15, 30, 45, 60]:
+        if not tx.billing_method and not tx.collection_method and tx.customer_name not in missing_billing_seen:
+            missing_billing_seen.add(tx.customer_name)
+            report.missing_billing_method.append(tx.customer_name)
+        if tx.calculated_terms is not None and tx.calculated_terms not in _STANDARD_TERMS:
             report.terms_anomalies.append({"customer_name": tx.customer_name, "calculated_terms": tx.calculated_terms})
 
+    # A credit only counts as unapplied once every invoice in the file has been seen.
+    for tx in open_credits:
+        if tx.customer_internal_id not in customers_with_open_invoice:
+            report.unapplied_credits.append({"customer_name": tx.customer_name, "credit_amount": str(tx.amount_remaining)})
+
     for name, ids in name_to_ids.items():
         if len(ids) > 1:
             report.duplicate_names.append({"customer_name": name, "internal_ids": sorted(ids)})
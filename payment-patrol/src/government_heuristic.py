@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from .models import GovernmentHeuristicResult
 
@@ -17,14 +18,34 @@ HIGH_PATTERNS = [
 MEDIUM_PATTERNS = [r"\bauthority\b", r"\bdistrict\b", r"\bcommission\b", r"\bboard of education\b", r"\bcommunity college\b", r"\btribal\b"]
 
 
+_HIGH_COMPILED = [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in HIGH_PATTERNS]
+_MEDIUM_COMPILED = [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in MEDIUM_PATTERNS]
+# One alternation per tier answers "does any pattern match" in a single scan.
+# Alternation reports the leftmost match rather than the first pattern in list
+# order, so hits are re-checked pattern by pattern to keep matched_pattern stable.
+_HIGH_ANY = re.compile("|".join(HIGH_PATTERNS), re.IGNORECASE)
+_MEDIUM_ANY = re.compile("|".join(MEDIUM_PATTERNS), re.IGNORECASE)
+
+
+def _first_matching_pattern(name: str, any_re: re.Pattern[str], compiled: list[tuple[str, re.Pattern[str]]]) -> str | None:
+    if any_re.search(name) is None:
+        return None
+    for pattern, regex in compiled:
+        if regex.search(name):
+            return pattern
+    return None
+
+
+# Exports repeat each customer's name on every invoice row.
+@lru_cache(maxsize=8192)
 def classify_government_name(customer_name: str) -> GovernmentHeuristicResult:
     name = customer_name.strip()
-    for pattern in HIGH_PATTERNS:
-        if re.search(pattern, name, flags=re.IGNORECASE):
-            return GovernmentHeuristicResult(is_government=True, confidence="high", matched_pattern=pattern)
+    pattern = _first_matching_pattern(name, _HIGH_ANY, _HIGH_COMPILED)
+    if pattern is not None:
+        return GovernmentHeuristicResult(is_government=True, confidence="high", matched_pattern=pattern)
 
-    for pattern in MEDIUM_PATTERNS:
-        if re.search(pattern, name, flags=re.IGNORECASE):
-            return GovernmentHeuristicResult(is_government=True, confidence="medium", matched_pattern=pattern)
+    pattern = _first_matching_pattern(name, _MEDIUM_ANY, _MEDIUM_COMPILED)
+    if pattern is not None:
+        return GovernmentHeuristicResult(is_government=True, confidence="medium", matched_pattern=pattern)
 
     return GovernmentHeuristicResult(is_government=False, confidence="none", matched_pattern=None)
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import csv
 import io
+import re
+import sys
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import BinaryIO, Iterator, Optional
 
 from .government_heuristic import classify_government_name
 from .models import ARTransaction
@@ -23,10 +26,32 @@ def _none_if_blank(value: str) -> Optional[str]:
     return stripped or None
 
 
+# ASCII-only fast paths for the layouts NetSuite actually exports. Anything they
+# reject (or that fails date()) falls through to the strptime loop, so accepted
+# inputs and errors stay exactly as strptime defines them.
+_US_DATE_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}|[0-9]{2})")
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> Optional[date]:
     value = (value or "").strip()
     if not value:
         return None
+    try:
+        match = _US_DATE_RE.fullmatch(value)
+        if match:
+            month, day, year = match.groups()
+            if len(year) == 2:
+                # %y pivot: 69-99 -> 1900s, 00-68 -> 2000s.
+                year = int(year) + (1900 if int(year) >= 69 else 2000)
+            return date(int(year), int(month), int(day))
+        match = _ISO_DATE_RE.fullmatch(value)
+        if match:
+            year, month, day = match.groups()
+            return date(int(year), int(month), int(day))
+    except ValueError:
+        pass
     for fmt in ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d"):
         try:
             return datetime.strptime(value, fmt).date()
@@ -39,7 +64,10 @@ def _parse_decimal(value: str) -> Decimal:
     normalized = (value or "0").replace(",", "").strip()
     if normalized.startswith("(") and normalized.endswith(")"):
         normalized = f"-{normalized[1:-1].strip()}"
-    return Decimal(normalized or "0")
+    amount = Decimal(normalized or "0")
+    if not amount.is_finite():
+        raise ValueError(f"Unsupported amount: {value}")
+    return amount
 
 
 def _parse_int(value: str) -> Optional[int]:
@@ -71,7 +99,22 @@ def _normalize_header(value: str | None) -> str:
 
 
 def parse_csv(content: bytes, entity: str) -> tuple[list[ARTransaction], Decimal]:
-    csv_rows = csv.reader(io.StringIO(content.decode("utf-8-sig")))
+    return parse_csv_file(io.BytesIO(content), entity=entity)
+
+
+def parse_csv_file(stream: BinaryIO, entity: str) -> tuple[list[ARTransaction], Decimal]:
+    """Parse an export from a binary file object, decoding it incrementally.
+
+    The stream stays open for the caller; only the text wrapper is detached.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        return _parse_rows(csv.reader(text), entity)
+    finally:
+        text.detach()
+
+
+def _parse_rows(csv_rows: Iterator[list[str]], entity: str) -> tuple[list[ARTransaction], Decimal]:
     raw_headers = next(csv_rows, [])
     parsed_headers = [_normalize_header(h) for h in raw_headers]
     expected_headers = [_normalize_header(h) for h in FLEETIO_HEADERS]
@@ -94,66 +137,83 @@ def parse_csv(content: bytes, entity: str) -> tuple[list[ARTransaction], Decimal
         row_values = row_values[:len(expected_headers)]
         if len(row_values) < len(expected_headers):
             row_values += [""] * (len(expected_headers) - len(row_values))
-        row = dict(zip(expected_headers, row_values))
-
-        tx_type = row["Type"].strip()
+        # Positional unpack in FLEETIO_HEADERS order; no per-row dict.
+        (
+            tx_type, document_number, name, invoice_date_raw, amount_remaining_raw, account, status, due_date_raw, days_overdue_raw,
+            amount_raw, currency, internal_id, email, category, fleetio_account, transaction_terms_raw,
+            customer_terms_raw, billing_method, collection_method, po_number, approval_status, source, posting_period,
+            subsidiary, calculated_terms_raw, days_since_invoice, days_overdue_calc, segment_hint_raw, invoice_date_iso, due_date_iso,
+        ) = row_values
+
+        tx_type = sys.intern(tx_type.strip())
         if tx_type not in allowed:
             continue
 
-        amount_remaining = _parse_decimal(row["Amount Remaining"])
+        amount_remaining = _parse_decimal(amount_remaining_raw)
         is_credit = tx_type in {"Credit Memo", "Payment"}
         signed = -amount_remaining if is_credit else amount_remaining
 
-        invoice_date = _parse_date(row["Date"])
+        invoice_date = _parse_date(invoice_date_raw)
         if invoice_date is None:
             raise ValueError("Date is required")
 
-        due_date = _parse_date(row["Due Date"]) or _parse_date(row["Due Date ISO"])
-        days_overdue = _parse_int(row["Days Overdue"])
-        calculated_terms = _parse_int(row["Calculated Terms"])
-        effective_terms = _resolve_effective_terms(calculated_terms, _none_if_blank(row["Terms (Transaction)"]), _none_if_blank(row["Terms (Customer)"]))
+        due_date = _parse_date(due_date_raw) or _parse_date(due_date_iso)
+        days_overdue = _parse_int(days_overdue_raw)
+        calculated_terms = _parse_int(calculated_terms_raw)
+        transaction_terms = _none_if_blank(transaction_terms_raw)
+        customer_terms = _none_if_blank(customer_terms_raw)
+        effective_terms = _resolve_effective_terms(calculated_terms, transaction_terms, customer_terms)
 
-        heuristic = classify_government_name(row["Name"])
-        segment_hint = _none_if_blank(row["Segment Hint"])
+        heuristic = classify_government_name(name)
+        segment_hint = _none_if_blank(segment_hint_raw)
         is_government = (segment_hint or "").upper() == "GOV" or heuristic.is_government
-        dpd = days_overdue if days_overdue is not None else (_parse_int(row["Days Overdue Calc"]) or 0)
-
-        tx = ARTransaction(
+        days_overdue_calc = _parse_int(days_overdue_calc)
+        dpd = days_overdue if days_overdue is not None else (days_overdue_calc or 0)
+
+        # Names and IDs repeat on every row for a customer; interning keeps one
+        # string per customer and lets grouping dicts match on identity.
+        customer_name = sys.intern(name.strip())
+        subsidiary = subsidiary.strip()
+        # Every value below is already typed by the _parse_* helpers, so skip
+        # re-validating all 37 fields per row.
+        tx = ARTransaction.model_construct(
             type=tx_type,
-            document_number=row["Document Number"].strip(),
-            customer_name=row["Name"].strip(),
+            document_number=document_number.strip(),
+            customer_name=customer_name,
             invoice_date=invoice_date,
             amount_remaining=amount_remaining,
-            account=row["Account"].strip(),
-            status=row["Status"].strip(),
+            account=account.strip(),
+            status=status.strip(),
             due_date=due_date,
             days_overdue=days_overdue,
-            original_amount=_parse_decimal(row["Amount"]),
-            currency=row["Currency"].strip(),
-            customer_internal_id=row["Internal ID"].strip(),
-            customer_email=_none_if_blank(row["Email"]),
-            customer_category=_none_if_blank(row["Category"]),
-            fleetio_account=_none_if_blank(row["Fleetio Account"]),
-            transaction_terms=_none_if_blank(row["Terms (Transaction)"]),
-            customer_default_terms=_none_if_blank(row["Terms (Customer)"]),
-            billing_method=_none_if_blank(row["Billing Method"]),
-            collection_method=_none_if_blank(row["Collection Method"]),
-            po_number=_none_if_blank(row["PO Number"]),
-            approval_status=_none_if_blank(row["Approval Status"]),
-            source=_none_if_blank(row["Source"]),
-            posting_period=_none_if_blank(row["Posting Period"]),
-            subsidiary=row["Subsidiary"].strip(),
+            original_amount=_parse_decimal(amount_raw),
+            currency=currency.strip(),
+            customer_internal_id=sys.intern(internal_id.strip()),
+            customer_email=_none_if_blank(email),
+            customer_category=_none_if_blank(category),
+            fleetio_account=_none_if_blank(fleetio_account),
+            transaction_terms=transaction_terms,
+            customer_default_terms=customer_terms,
+            billing_method=_none_if_blank(billing_method),
+            collection_method=_none_if_blank(collection_method),
+            po_number=_none_if_blank(po_number),
+            approval_status=_none_if_blank(approval_status),
+            source=_none_if_blank(source),
+            posting_period=_none_if_blank(posting_period),
+            subsidiary=subsidiary,
             calculated_terms=calculated_terms,
-            days_since_invoice=_parse_int(row["Days Since Invoice"]),
-            days_overdue_calc=_parse_int(row["Days Overdue Calc"]),
+            days_since_invoice=_parse_int(days_since_invoice),
+            days_overdue_calc=days_overdue_calc,
             segment_hint=segment_hint,
-            invoice_date_iso=_none_if_blank(row["Invoice Date ISO"]),
-            due_date_iso=_none_if_blank(row["Due Date ISO"]),
+            invoice_date_iso=_none_if_blank(invoice_date_iso),
+            due_date_iso=_none_if_blank(due_date_iso),
             signed_amount_remaining=signed,
             is_credit=is_credit,
             is_government=is_government,
             effective_terms=effective_terms,
             days_past_terms=max(dpd, 0),
+            customer_name_lc=sys.intern(customer_name.lower()),
+            subsidiary_lc=subsidiary.lower(),
         )
         transactions.append(tx)
         signed_total += signed
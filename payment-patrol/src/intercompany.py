@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
+
 from .models import ARTransaction
 
 INTERCOMPANY_KEYWORDS = ("fleetio", "rarestep", "stingray", "auto integrate")
+_INTERCOMPANY_RE = re.compile("|".join(re.escape(keyword) for keyword in INTERCOMPANY_KEYWORDS))
 
 
 def filter_intercompany(
@@ -12,8 +15,7 @@ def filter_intercompany(
     intercompany_transactions: list[ARTransaction] = []
 
     for transaction in transactions:
-        customer_name = transaction.customer_name.lower()
-        if any(keyword in customer_name for keyword in INTERCOMPANY_KEYWORDS):
+        if _INTERCOMPANY_RE.search(transaction.customer_name_lc):
             intercompany_transactions.append(transaction)
             continue
 
@@ -4,16 +4,22 @@ from datetime import date
 from decimal import Decimal
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class GovernmentHeuristicResult(BaseModel):
+    # Frozen so classify_government_name can hand out cached instances.
+    model_config = ConfigDict(frozen=True)
+
     is_government: bool
     confidence: str
     matched_pattern: Optional[str] = None
 
 
 class ARTransaction(BaseModel):
+    # Parsed rows are shared across the pipeline and never edited in place.
+    model_config = ConfigDict(frozen=True)
+
     type: str
     document_number: str
     customer_name: str
@@ -51,6 +57,31 @@ class ARTransaction(BaseModel):
     effective_terms: int
     days_past_terms: int
 
+    # Lowercased once per row for the keyword matching in calculations and
+    # intercompany. Always derived from the source fields: the validator covers
+    # direct construction and model_copy recomputes them on update. Parsing
+    # uses model_construct and supplies them itself.
+    customer_name_lc: str
+    subsidiary_lc: str
+
+    @model_validator(mode="before")
+    @classmethod
+    def _lowercase_names(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            data = dict(data)
+            if isinstance(data.get("customer_name"), str):
+                data["customer_name_lc"] = data["customer_name"].lower()
+            if isinstance(data.get("subsidiary"), str):
+                data["subsidiary_lc"] = data["subsidiary"].lower()
+        return data
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> ARTransaction:
+        if update:
+            update = dict(update)
+            update["customer_name_lc"] = update.get("customer_name", self.customer_name).lower()
+            update["subsidiary_lc"] = update.get("subsidiary", self.subsidiary).lower()
+        return super().model_copy(update=update, deep=deep)
+
 
 class CustomerSummary(BaseModel):
     customer_internal_id: str
@@ -4,6 +4,8 @@ from decimal import Decimal
 
 from .models import AnalysisReports, Anomaly, CustomerSummary, DataQualityReport, PortfolioSummary, TermsDistribution
 
+_CX_MIN_AR = Decimal("5000")
+
 
 def build_reports(
     portfolio: PortfolioSummary,
@@ -12,17 +14,11 @@ def build_reports(
     anomalies: list[Anomaly],
     data_quality: DataQualityReport,
 ) -> AnalysisReports:
-    cx_escalation_eligible = lambda c: (
-        abs(c.total_ar) >= Decimal("5000")
-        and (
-            (not c.is_government and c.oldest_past_due_days >= 45)
-            or ((c.billing_method or "").lower().startswith("auto") and c.oldest_past_due_days >= 21)
-            or (c.is_government and c.oldest_past_due_days >= 90)
-        )
-    )
-
     top10 = [{"customer_name": c.customer_name, "amount": str(c.total_past_due), "days": c.oldest_past_due_days} for c in sorted(customers, key=lambda x: x.total_past_due, reverse=True)[:10]]
-    red_anomalies = [a.model_dump(mode="json") for a in anomalies if a.severity == "red"]
+    # Anomalies and the data quality report appear in several sections; serialize each once.
+    anomaly_dumps = [a.model_dump(mode="json") for a in anomalies]
+    red_anomalies = [dumped for a, dumped in zip(anomalies, anomaly_dumps) if a.severity == "red"]
+    data_quality_dump = data_quality.model_dump(mode="json")
 
     cfo = {
         "health_scorecard": portfolio.health_scorecard,
@@ -41,31 +37,60 @@ def build_reports(
         **cfo,
         "aging_buckets": {k: str(v) for k, v in portfolio.aging_buckets.items()},
         "terms_distribution": terms.model_dump(mode="json"),
-        "all_anomalies": [a.model_dump(mode="json") for a in anomalies],
-        "data_quality": data_quality.model_dump(mode="json"),
+        "all_anomalies": anomaly_dumps,
+        "data_quality": data_quality_dump,
         "concentration_top_10": top10,
         "segment_breakdown": {"government_ar": str(portfolio.government_ar), "commercial_ar": str(portfolio.commercial_ar)},
         "intercompany_ar": str(portfolio.intercompany_ar),
     }
 
+    # One pass over customers: each qualifying customer is serialized once and
+    # the same dict is shared by every action section it lands in.
+    auto_pay_failures: list[dict] = []
+    tier_1_remittance: list[dict] = []
+    tier_2: list[dict] = []
+    cx_escalation_candidates: list[dict] = []
+    cx: list[dict] = []
+    for c in customers:
+        billing_method = (c.billing_method or "").lower()
+        is_auto = billing_method.startswith("auto")
+        days = c.oldest_past_due_days
+        in_auto = is_auto and days > 5
+        in_tier_1 = c.priority_tier == "Tier 1" and billing_method == "remittance"
+        in_tier_2 = c.priority_tier == "Tier 2"
+        cx_eligible = abs(c.total_ar) >= _CX_MIN_AR and (
+            (not c.is_government and days >= 45)
+            or (is_auto and days >= 21)
+            or (c.is_government and days >= 90)
+        )
+        if not (in_auto or in_tier_1 or in_tier_2 or cx_eligible):
+            continue
+
+        dumped = c.model_dump(mode="json")
+        if in_auto:
+            auto_pay_failures.append(dumped)
+        if in_tier_1:
+            tier_1_remittance.append(dumped)
+        if in_tier_2:
+            tier_2.append(dumped)
+        if cx_eligible:
+            cx_escalation_candidates.append(dumped)
+            cx.append(
+                {
+                    "customer_name": c.customer_name,
+                    "ar_amount": str(c.total_ar),
+                    "days_past_due": days,
+                    "last_known_activity": "N/A",
+                    "context_note": c.suggested_action,
+                }
+            )
+
     action_sections = {
-        "auto_pay_failures": [c.model_dump(mode="json") for c in customers if (c.billing_method or "").lower().startswith("auto") and c.oldest_past_due_days > 5],
-        "tier_1_remittance": [c.model_dump(mode="json") for c in customers if c.priority_tier == "Tier 1" and (c.billing_method or "").lower() == "remittance"],
-        "tier_2": [c.model_dump(mode="json") for c in customers if c.priority_tier == "Tier 2"],
-        "cx_escalation_candidates": [c.model_dump(mode="json") for c in customers if cx_escalation_eligible(c)],
-        "data_quality_actions": data_quality.model_dump(mode="json"),
+        "auto_pay_failures": auto_pay_failures,
+        "tier_1_remittance": tier_1_remittance,
+        "tier_2": tier_2,
+        "cx_escalation_candidates": cx_escalation_candidates,
+        "data_quality_actions": data_quality_dump,
     }
 
-    cx = [
-        {
-            "customer_name": c.customer_name,
-            "ar_amount": str(c.total_ar),
-            "days_past_due": c.oldest_past_due_days,
-            "last_known_activity": "N/A",
-            "context_note": c.suggested_action,
-        }
-        for c in customers
-        if cx_escalation_eligible(c)
-    ]
-
     return AnalysisReports(cfo_summary=cfo, controller_detail=controller, ar_action_plan=action_sections, cx_escalation=cx, slack_blocks={})
@@ -84,8 +84,8 @@ def tier_for_score(score: float) -> str:
     return "Tier 4"
 
 
-def _suggested_action(c: CustomerSummary) -> str:
-    if (c.billing_method or "").lower().startswith("auto") and c.oldest_past_due_days > 5:
+def _suggested_action(c: CustomerSummary, auto_pay_failed: bool) -> str:
+    if auto_pay_failed:
         return f"Auto-pay failed {c.oldest_past_due_days} days ago. Verify payment method on file. If card issue, request updated payment info. Low-effort, high-impact recovery."
     if c.is_government and c.oldest_past_due_days > 0:
         return f"Government account, Net {c.effective_terms} terms. {c.oldest_past_due_days} days past due is within normal range for this segment. Send formal reminder with PO reference. Escalate to CX only if 90+ DPD."
@@ -106,12 +106,13 @@ def score_customers(customers: list[CustomerSummary]) -> list[CustomerSummary]:
         f5 = _history_factor(c.oldest_past_due_days)
 
         score = (f1 * 0.25) + (f2 * 0.25) + (f3 * 0.20) + (f4 * 0.15) + (f5 * 0.15)
-        if (c.billing_method or "").lower().startswith("auto") and c.oldest_past_due_days > 5:
+        auto_pay_failed = (c.billing_method or "").lower().startswith("auto") and c.oldest_past_due_days > 5
+        if auto_pay_failed:
             score += 1.0
 
         score = max(0.0, min(5.0, score))
         c.priority_score = round(score, 2)
         c.priority_tier = tier_for_score(c.priority_score)
         c.health_color = "red" if c.priority_score >= 4 else ("yellow" if c.priority_score >= 3 else "green")
-        c.suggested_action = _suggested_action(c)
+        c.suggested_action = _suggested_action(c, auto_pay_failed)
     return sorted(customers, key=lambda x: x.priority_score, reverse=True)
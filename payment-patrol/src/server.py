@@ -4,15 +4,17 @@ import json
 import time
 from datetime import date
 from decimal import Decimal
+from typing import BinaryIO
 
-from fastapi import FastAPI, File, Form, UploadFile
+from fastapi import FastAPI, File, Form, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from .anomaly import detect_anomalies
 from .calculations import compute_portfolio_summary
 from .customer_metrics import build_customer_summaries
 from .data_quality import build_data_quality_report
 from .formatters import build_action_blocks, build_cfo_blocks, build_controller_blocks, build_cx_blocks
-from .ingest import parse_csv
+from .ingest import parse_csv_file
 from .intercompany import filter_intercompany
 from .models import AnalysisMeta, AnalysisResult, IntercompanyCustomerSummary, IntercompanySummary
 from .report_builder import build_reports
@@ -34,12 +36,40 @@ async def analyze(
     run_date: str | None = Form(default=None),
     prior_snapshot_json: str | None = Form(default=None),
     total_invoiced_amount: float | None = Form(default=None),
-) -> AnalysisResult:
+) -> Response:
     start = time.perf_counter()
     parsed_run_date = date.fromisoformat(run_date) if run_date else date.today()
 
-    content = await file.read()
-    transactions, signed_total = parse_csv(content, entity=entity)
+    # Starlette has already spooled the upload (to disk past 1 MB). Parsing and
+    # every analysis stage are CPU-bound Python, so they run together on one
+    # worker thread: the event loop stays free for other requests, and splitting
+    # the stages across threads would only contend for the GIL.
+    await file.seek(0)
+    result = await run_in_threadpool(
+        _analyze_upload,
+        file.file,
+        entity,
+        parsed_run_date,
+        prior_snapshot_json,
+        total_invoiced_amount,
+        start,
+    )
+    # Returning the model would make FastAPI dump it, re-validate the dump
+    # against response_model, and encode it again with json.dumps. The result
+    # is already an AnalysisResult, so serialize it once with pydantic-core.
+    # response_model stays on the route for the OpenAPI schema.
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+def _analyze_upload(
+    stream: BinaryIO,
+    entity: str,
+    parsed_run_date: date,
+    prior_snapshot_json: str | None,
+    total_invoiced_amount: float | None,
+    start: float,
+) -> AnalysisResult:
+    transactions, signed_total = parse_csv_file(stream, entity)
     external_transactions, intercompany_transactions = filter_intercompany(transactions)
 
     customers = build_customer_summaries(external_transactions)
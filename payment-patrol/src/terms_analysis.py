@@ -6,26 +6,44 @@ from .models import ARTransaction, TermsBucket, TermsDistribution
 
 
 STANDARD = [0, 15, 30, 45, 60]
+# Non-standard terms are reported in the Net 30 bucket.
+_STANDARD_INDEX = {term: idx for idx, term in enumerate(STANDARD)}
+_DEFAULT_INDEX = _STANDARD_INDEX[30]
+_STANDARD_DECIMALS = tuple(Decimal(term) for term in STANDARD)
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_DAYS = Decimal("365")
+# Annual cost of capital used to price days of outstanding terms.
+_WACC = Decimal("0.05")
+_NET15 = Decimal("15")
+_DEFAULT_AVG_TERMS = Decimal("30")
 
 
 def analyze_terms(transactions: list[ARTransaction], total_ar: Decimal) -> TermsDistribution:
-    bucket_data: dict[str, TermsBucket] = {str(k): TermsBucket(count=0, ar_amount=Decimal("0"), pct_of_ar=0.0) for k in STANDARD}
-    weighted_total = Decimal("0")
-    amount_total = Decimal("0")
+    counts = [0] * len(STANDARD)
+    amounts = [_ZERO] * len(STANDARD)
+    weighted_total = _ZERO
+    amount_total = _ZERO
 
     for tx in transactions:
-        term = tx.effective_terms if tx.effective_terms in STANDARD else 30
-        key = str(term)
-        b = bucket_data[key]
-        b.count += 1
-        b.ar_amount += tx.signed_amount_remaining
-        weighted_total += Decimal(term) * max(tx.signed_amount_remaining, Decimal("0"))
-        amount_total += max(tx.signed_amount_remaining, Decimal("0"))
-
-    for key, b in bucket_data.items():
-        b.pct_of_ar = float((b.ar_amount / total_ar * Decimal("100")) if total_ar else Decimal("0"))
-
-    weighted_avg = float((weighted_total / amount_total) if amount_total else Decimal("30"))
-    impact = (Decimal(str(weighted_avg)) - Decimal("15")) * (total_ar / Decimal("365")) * Decimal("0.05")
+        idx = _STANDARD_INDEX.get(tx.effective_terms, _DEFAULT_INDEX)
+        amount = tx.signed_amount_remaining
+        counts[idx] += 1
+        amounts[idx] += amount
+        positive = amount if amount >= _ZERO else _ZERO
+        weighted_total += _STANDARD_DECIMALS[idx] * positive
+        amount_total += positive
+
+    bucket_data: dict[str, TermsBucket] = {
+        str(term): TermsBucket(
+            count=count,
+            ar_amount=amount,
+            pct_of_ar=float((amount / total_ar * _HUNDRED) if total_ar else _ZERO),
+        )
+        for term, count, amount in zip(STANDARD, counts, amounts)
+    }
+
+    weighted_avg = float((weighted_total / amount_total) if amount_total else _DEFAULT_AVG_TERMS)
+    impact = (Decimal(str(weighted_avg)) - _NET15) * (total_ar / _DAYS) * _WACC
 
     return TermsDistribution(by_bucket=bucket_data, weighted_avg_terms=weighted_avg, working_capital_impact_vs_net15=impact)
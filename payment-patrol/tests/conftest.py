@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.customer_metrics import build_customer_summaries
+from src.ingest import parse_csv, parse_csv_file
+from src.scoring import score_customers
+
+FIXTURES = Path("tests/fixtures")
+
+
+def parse_fixture(name: str, entity: str):
+    """Parse a fixture export straight from disk, without reading it into bytes first."""
+    with open(FIXTURES / name, "rb") as stream:
+        return parse_csv_file(stream, entity=entity)
+
+
+@pytest.fixture(scope="session")
+def fleetio_txs():
+    txs, _ = parse_fixture("sample_fleetio.csv", entity="fleetio")
+    return txs
+
+
+@pytest.fixture(scope="session")
+def fleetio_by_docnum(fleetio_txs):
+    return {t.document_number: t for t in fleetio_txs}
+
+
+@pytest.fixture(scope="session")
+def fleetio_customers(fleetio_txs):
+    return build_customer_summaries(fleetio_txs)
+
+
+@pytest.fixture(scope="session")
+def fleetio_scored(fleetio_txs):
+    # score_customers mutates the summaries in place, so it gets its own copy.
+    return score_customers(build_customer_summaries(fleetio_txs))
+
+
+@pytest.fixture(scope="session")
+def fleetio_customers_by_name(fleetio_scored):
+    return {c.customer_name: c for c in fleetio_scored}
+
+
+@pytest.fixture(scope="session")
+def ai_llc_bytes():
+    return (FIXTURES / "sample_ai_llc.csv").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def ai_llc_fleetio_txs(ai_llc_bytes):
+    txs, _ = parse_csv(ai_llc_bytes, entity="fleetio")
+    return txs
+
+
+@pytest.fixture(scope="session")
+def ai_llc_ai_txs(ai_llc_bytes):
+    txs, _ = parse_csv(ai_llc_bytes, entity="auto_integrate")
+    return txs
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.customer_metrics import build_customer_summaries
+from src.ingest import parse_csv
+from src.scoring import score_customers
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def fleetio_bytes():
+    return Path("tests/fixtures/sample_fleetio.csv").read_bytes()
+
+
+def test_bench_parse_csv(benchmark, fleetio_bytes) -> None:
+    txs, _ = benchmark(parse_csv, fleetio_bytes, "fleetio")
+    assert len(txs) == 20
+
+
+def test_bench_score_customers(benchmark, fleetio_txs) -> None:
+    # score_customers mutates its input, so each round builds fresh summaries.
+    scored = benchmark(lambda: score_customers(build_customer_summaries(fleetio_txs)))
+    assert scored
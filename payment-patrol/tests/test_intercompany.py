@@ -1,39 +1,43 @@
 from __future__ import annotations
 
-from pathlib import Path
+import pytest
 
-from src.ingest import parse_csv
 from src.intercompany import filter_intercompany
 
 
-def _sample_transaction_with_name(customer_name: str):
-    transactions, _ = parse_csv(Path("tests/fixtures/sample_fleetio.csv").read_bytes(), entity="fleetio")
-    return transactions[0].model_copy(update={"customer_name": customer_name})
+@pytest.fixture(scope="module")
+def base_tx(fleetio_txs):
+    return fleetio_txs[0]
 
 
-def test_filter_classifies_fleetio_as_intercompany() -> None:
-    transaction = _sample_transaction_with_name("Fleetio")
-
-    external_transactions, intercompany_transactions = filter_intercompany([transaction])
-
-    assert external_transactions == []
-    assert intercompany_transactions == [transaction]
+def _with_name(transaction, customer_name: str):
+    return transaction.model_copy(update={"customer_name": customer_name})
 
 
-def test_filter_classifies_enterprise_as_external() -> None:
-    transaction = _sample_transaction_with_name("Enterprise Holdings")
+@pytest.mark.parametrize(
+    ("customer_name", "is_intercompany"),
+    [("Fleetio", True), ("Enterprise Holdings", False)],
+)
+def test_filter_classifies_by_customer_name(base_tx, customer_name: str, is_intercompany: bool) -> None:
+    transaction = _with_name(base_tx, customer_name)
 
     external_transactions, intercompany_transactions = filter_intercompany([transaction])
 
-    assert external_transactions == [transaction]
-    assert intercompany_transactions == []
+    assert intercompany_transactions == ([transaction] if is_intercompany else [])
+    assert external_transactions == ([] if is_intercompany else [transaction])
 
 
-def test_filter_preserves_original_transaction_count() -> None:
-    fleetio = _sample_transaction_with_name("Fleetio")
-    external = _sample_transaction_with_name("Enterprise Holdings")
-    transactions = [fleetio, external]
+def test_filter_preserves_original_transaction_count(base_tx) -> None:
+    transactions = [_with_name(base_tx, "Fleetio"), _with_name(base_tx, "Enterprise Holdings")]
 
     external_transactions, intercompany_transactions = filter_intercompany(transactions)
 
     assert len(external_transactions) + len(intercompany_transactions) == len(transactions)
+
+
+def test_lowercased_names_follow_source_fields(base_tx) -> None:
+    renamed = base_tx.model_copy(update={"customer_name": "Fleetio Holdings", "customer_name_lc": "stale"})
+    assert renamed.customer_name_lc == "fleetio holdings"
+
+    rebuilt = type(base_tx)(**{**base_tx.model_dump(), "subsidiary": "Auto Integrate LLC", "subsidiary_lc": "stale"})
+    assert rebuilt.subsidiary_lc == "auto integrate llc"